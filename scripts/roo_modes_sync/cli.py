@@ -13,8 +13,9 @@ import argparse
 import os
 import sys
 import logging
+from functools import lru_cache
 from pathlib import Path
-# typing imports removed as they're not used in this file
+from typing import List, Optional
 
 # Handle both direct execution and module imports
 try:
@@ -58,6 +59,17 @@ def get_default_modes_dir() -> Path:
     if env_modes_dir:
         return Path(env_modes_dir)
     
+    return _script_relative_modes_dir()
+
+
+@lru_cache(maxsize=None)
+def _script_relative_modes_dir() -> Path:
+    """
+    Resolve the modes directory next to the project root once per process.
+    
+    Returns:
+        Path to PROJECT_ROOT/modes
+    """
     # Determine script location and project root
     # This script is at: PROJECT_ROOT/scripts/roo_modes_sync/cli.py
     # The modes directory is at: PROJECT_ROOT/modes/
@@ -80,6 +92,9 @@ def parse_strategy_argument(strategy_arg: str) -> tuple[str, dict]:
     """
     import yaml
     
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    safe_loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    
     # Check if it's a file path (contains / or \ or ends with .yaml/.yml)
     if ('/' in strategy_arg or '\\' in strategy_arg or 
         strategy_arg.endswith('.yaml') or strategy_arg.endswith('.yml')):
@@ -91,7 +106,7 @@ def parse_strategy_argument(strategy_arg: str) -> tuple[str, dict]:
         
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=safe_loader)
             
             if not isinstance(config, dict):
                 raise SyncError(f"Invalid configuration file format: {config_path}")
@@ -116,6 +131,24 @@ def parse_strategy_argument(strategy_arg: str) -> tuple[str, dict]:
         return strategy_arg, {}
 
 
+def resolve_project_dir(project_dir: Optional[str]) -> Path:
+    """
+    Resolve the project directory used by the backup commands.
+    
+    Args:
+        project_dir: Project directory given on the command line, if any
+        
+    Returns:
+        Path to the project directory, defaulting to the workspace root
+    """
+    if project_dir:
+        return Path(project_dir)
+    
+    # Default to workspace root (parent directory of modes directory)
+    script_dir = Path(__file__).resolve().parent  # scripts/roo_modes_sync/
+    return script_dir.parent.parent               # PROJECT_ROOT/
+
+
 def sync_global(args: argparse.Namespace) -> int:
     """
     Synchronize modes to the global configuration.
@@ -287,13 +320,7 @@ def backup_files(args: argparse.Namespace) -> int:
         Exit code (0 for success, non-zero for failure)
     """
     try:
-        # Determine project directory - use workspace root if not specified
-        if hasattr(args, 'project_dir') and args.project_dir:
-            project_dir = Path(args.project_dir)
-        else:
-            # Default to workspace root (parent directory of modes directory)
-            script_dir = Path(__file__).resolve().parent  # scripts/roo_modes_sync/
-            project_dir = script_dir.parent.parent       # PROJECT_ROOT/
+        project_dir = resolve_project_dir(getattr(args, 'project_dir', None))
         
         backup_manager = BackupManager(project_dir)
         
@@ -338,13 +365,7 @@ def restore_files(args: argparse.Namespace) -> int:
         Exit code (0 for success, non-zero for failure)
     """
     try:
-        # Determine project directory - use workspace root if not specified
-        if hasattr(args, 'project_dir') and args.project_dir:
-            project_dir = Path(args.project_dir)
-        else:
-            # Default to workspace root (parent directory of modes directory)
-            script_dir = Path(__file__).resolve().parent  # scripts/roo_modes_sync/
-            project_dir = script_dir.parent.parent       # PROJECT_ROOT/
+        project_dir = resolve_project_dir(getattr(args, 'project_dir', None))
         
         backup_manager = BackupManager(project_dir)
         
@@ -421,13 +442,7 @@ def list_backups(args: argparse.Namespace) -> int:
         Exit code (0 for success, non-zero for failure)
     """
     try:
-        # Determine project directory - use workspace root if not specified
-        if hasattr(args, 'project_dir') and args.project_dir:
-            project_dir = Path(args.project_dir)
-        else:
-            # Default to workspace root (parent directory of modes directory)
-            script_dir = Path(__file__).resolve().parent  # scripts/roo_modes_sync/
-            project_dir = script_dir.parent.parent       # PROJECT_ROOT/
+        project_dir = resolve_project_dir(getattr(args, 'project_dir', None))
         
         backup_manager = BackupManager(project_dir)
         
@@ -464,12 +479,12 @@ def list_backups(args: argparse.Namespace) -> int:
         return 1
 
 
-def main() -> int:
+def build_parser() -> argparse.ArgumentParser:
     """
-    Main CLI entry point.
+    Build the argument parser for all CLI commands.
     
     Returns:
-        Exit code (0 for success, non-zero for failure)
+        Configured ArgumentParser with one subparser per command
     """
     # Create main parser
     parser = argparse.ArgumentParser(
@@ -622,8 +637,22 @@ def main() -> int:
     )
     list_backups_parser.set_defaults(func=list_backups)
     
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main CLI entry point.
+    
+    Args:
+        argv: Command line arguments, excluding the program name.
+              If None, arguments are read from sys.argv.
+    
+    Returns:
+        Exit code (0 for success, non-zero for failure)
+    """
     # Parse arguments
-    args = parser.parse_args()
+    args = build_parser().parse_args(argv)
     
     # Run command function
     return args.func(args)
@@ -9,11 +9,19 @@ Provides functionality for discovering and categorizing mode YAML files:
 - Robust path handling
 """
 
+import copy
+import os
 import re
+import stat
+import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 import yaml
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Any, Tuple
 
 # Try relative imports first, fall back to absolute imports
 try:
@@ -23,9 +31,75 @@ except ImportError:
     # from exceptions import DiscoveryError  # Currently unused
     pass
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fields every mode file must define
+REQUIRED_MODE_FIELDS = ('slug', 'name', 'roleDefinition', 'groups')
+
+# Below this many files, validating serially is cheaper than starting a thread pool
+PARALLEL_VALIDATION_MIN_FILES = 8
+
+
+@lru_cache(maxsize=512)
+def _load_yaml_cached(data: bytes) -> Any:
+    """
+    Parse YAML bytes, memoized on the bytes themselves.
+    
+    Keying on the content rather than on file stats means an edit is
+    always seen, even one that keeps the size and lands within the
+    filesystem's mtime granularity. Parse errors propagate and are
+    therefore never cached. The returned object is shared between calls
+    and must not be mutated; use _load_yaml_file() to get a private copy.
+    
+    Args:
+        data: Raw contents of a YAML file
+        
+    Returns:
+        Parsed YAML content
+    """
+    return yaml.load(data, Loader=SafeLoader)
+
+
+def _load_yaml_file(path_str: str, required_keys: Tuple[str, ...] = ()) -> Tuple[bool, Any]:
+    """
+    Load a YAML file through the shared parse cache.
+    
+    A key that never appears in the raw bytes cannot be present in the
+    parsed mapping, so files missing any of required_keys are rejected
+    with a substring check before the YAML parser runs.
+    
+    Args:
+        path_str: Path to the YAML file
+        required_keys: Keys that must appear in the file contents
+        
+    Returns:
+        Tuple of (loaded, content) where content is a private copy of the
+        parsed YAML when loaded is True and an error message otherwise
+    """
+    try:
+        # Read in one call and let libyaml parse the contiguous buffer
+        data = Path(path_str).read_bytes()
+        
+        for key in required_keys:
+            if key.encode('utf-8') not in data:
+                return False, f"Mode file missing required field '{key}': {path_str}"
+        
+        return True, copy.deepcopy(_load_yaml_cached(data))
+    except yaml.YAMLError as e:
+        return False, f"YAML parsing error in {path_str}: {str(e)}"
+    except (FileNotFoundError, PermissionError) as e:
+        return False, f"File access error for {path_str}: {str(e)}"
+    except Exception as e:
+        return False, f"Unexpected error loading {path_str}: {str(e)}"
+
+
 class ModeDiscovery:
     """Handles dynamic discovery and categorization of mode files."""
     
@@ -36,8 +110,8 @@ class ModeDiscovery:
         Args:
             modes_dir: Path to directory containing mode YAML files
             recursive: Whether to search subdirectories recursively (default: True).
-                      When True, uses rglob() to find YAML files in all subdirectories.
-                      When False, uses glob() to find YAML files only in the root directory.
+                      When True, finds YAML files in all subdirectories.
+                      When False, finds YAML files only in the root directory.
         """
         self.modes_dir = modes_dir
         self.recursive = recursive
@@ -58,30 +132,88 @@ class ModeDiscovery:
         
         logger.debug(f"Initialized ModeDiscovery with directory: {self.modes_dir}, recursive: {self.recursive}")
     
-    def _get_yaml_files(self) -> List[Path]:
+    @property
+    def category_patterns(self) -> Mapping[str, Tuple[str, ...]]:
         """
-        Get all YAML files in the modes directory.
+        Regex patterns for each mode category, tried in category order.
+        
+        The mapping is read-only so it cannot drift from the compiled
+        alternation used by categorize_mode(); assign a new dict to change it.
         
         Returns:
-            List of Path objects for YAML files
+            Read-only mapping of category name to its slug patterns
+        """
+        return self._category_patterns
+    
+    @category_patterns.setter
+    def category_patterns(self, patterns: Dict[str, List[str]]) -> None:
+        """
+        Replace the category patterns and recompile the category alternation.
+        
+        Args:
+            patterns: Mapping of category name to its slug patterns
+        """
+        self._category_patterns = MappingProxyType({
+            category: tuple(category_patterns) for category, category_patterns in patterns.items()
+        })
+        
+        # Fold all category patterns into one alternation, tried in category order
+        self._category_re = re.compile('|'.join(
+            f"(?P<{category}>{'|'.join(f'(?:{pattern})' for pattern in category_patterns)})"
+            for category, category_patterns in self._category_patterns.items()
+        ))
+    
+    def _get_yaml_files(self) -> Iterator[Path]:
+        """
+        Yield all YAML files in the modes directory.
+        
+        Files are yielded as the directory walk finds them, so callers can
+        start validating before the walk has finished.
+        
+        Yields:
+            Path objects for YAML files
         """
         if not self.modes_dir.exists() or not self.modes_dir.is_dir():
-            return []
+            return
             
         try:
             if self.recursive:
-                # Use recursive glob to find YAML files in subdirectories
-                yaml_files = list(self.modes_dir.rglob("*.yaml"))
-                logger.debug(f"Found {len(yaml_files)} YAML files recursively in {self.modes_dir}")
+                yield from self._scan_yaml_files()
             else:
-                # Use non-recursive glob to find YAML files only in root directory
-                yaml_files = list(self.modes_dir.glob("*.yaml"))
-                logger.debug(f"Found {len(yaml_files)} YAML files non-recursively in {self.modes_dir}")
-            
-            return yaml_files
+                # A flat listing needs no file type checks; non-files fail validation later
+                for name in os.listdir(self.modes_dir):
+                    if name.endswith('.yaml'):
+                        yield self.modes_dir / name
         except Exception as e:
             logger.error(f"Error accessing modes directory {self.modes_dir}: {str(e)}")
-            return []
+    
+    def _scan_yaml_files(self) -> Iterator[Path]:
+        """
+        Walk the modes directory tree with os.scandir and yield YAML files.
+        
+        The directory entries returned by os.scandir already carry their
+        file type, so no extra stat() call is needed per entry. Symlinked
+        directories are not descended into, and unreadable directories are
+        skipped the same way rglob() skipped them.
+        
+        Yields:
+            Path objects for YAML files
+        """
+        stack = [str(self.modes_dir)]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except PermissionError as e:
+                logger.debug(f"Skipping unreadable directory {directory}: {str(e)}")
+                continue
+            
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.yaml') and entry.is_file():
+                        yield Path(entry.path)
     
     def discover_all_modes(self) -> Dict[str, List[str]]:
         """
@@ -100,9 +232,11 @@ class ModeDiscovery:
         # Clear cache for fresh discovery
         self._slug_to_path_cache = {}
         
-        # Get all YAML files using the appropriate search method
-        yaml_files = self._get_yaml_files()
-        if not yaml_files:
+        # Get YAML files using the appropriate search method, peeking at the
+        # first few to decide whether validation is worth a thread pool
+        yaml_file_iter = self._get_yaml_files()
+        first_files = list(islice(yaml_file_iter, PARALLEL_VALIDATION_MIN_FILES))
+        if not first_files:
             if not self.modes_dir.exists():
                 logger.warning(f"Modes directory does not exist: {self.modes_dir}")
             elif not self.modes_dir.is_dir():
@@ -111,9 +245,29 @@ class ModeDiscovery:
                 logger.info(f"No YAML files found in {self.modes_dir}")
             return categorized_modes
         
+        # Validate files concurrently; reads and libyaml parsing overlap across
+        # threads, and with the rest of the directory walk
+        if len(first_files) < PARALLEL_VALIDATION_MIN_FILES:
+            yaml_files = first_files
+            validity = [self._is_valid_mode_file(yaml_file) for yaml_file in yaml_files]
+        else:
+            yaml_files = []
+            futures = []
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for yaml_file in chain(first_files, yaml_file_iter):
+                    yaml_files.append(yaml_file)
+                    futures.append(executor.submit(self._is_valid_mode_file, yaml_file))
+                validity = [future.result() for future in futures]
+        
+        search_kind = "recursively" if self.recursive else "non-recursively"
+        logger.debug(f"Found {len(yaml_files)} YAML files {search_kind} in {self.modes_dir}")
+        
         # Process each YAML file
-        for yaml_file in yaml_files:
-            mode_slug = yaml_file.stem
+        total_modes = 0
+        for yaml_file, is_valid in zip(yaml_files, validity):
+            # Interned so repeated discoveries share one string per slug
+            mode_slug = sys.intern(yaml_file.stem)
             
             # Store the relative path from modes_dir for this slug
             try:
@@ -126,13 +280,14 @@ class ModeDiscovery:
                 logger.warning(f"Could not compute relative path for {yaml_file}, using fallback")
             
             # Skip if not a valid YAML file that can be loaded
-            if not self._is_valid_mode_file(yaml_file):
+            if not is_valid:
                 logger.warning(f"Skipping invalid mode file: {yaml_file}")
                 continue
             
             # Categorize the mode based on its slug
             category = self.categorize_mode(mode_slug)
             categorized_modes[category].append(mode_slug)
+            total_modes += 1
             logger.debug(f"Categorized {mode_slug} as {category}")
         
         # Sort within categories for consistency
@@ -140,7 +295,6 @@ class ModeDiscovery:
             categorized_modes[category].sort()
         
         # Log discovery results
-        total_modes = sum(len(modes) for modes in categorized_modes.values())
         logger.info(f"Discovered {total_modes} valid modes across {len(categorized_modes)} categories")
         return categorized_modes
     
@@ -154,12 +308,36 @@ class ModeDiscovery:
         Returns:
             Category name ('core', 'enhanced', 'specialized', or 'discovered')
         """
-        for category, patterns in self.category_patterns.items():
-            for pattern in patterns:
-                if re.match(pattern, mode_slug):
-                    return category
+        match = self._category_re.match(mode_slug)
+        return match.lastgroup if match else 'discovered'
+    
+    def _load_mode_config(self, yaml_file: Path,
+                          required_keys: Tuple[str, ...] = ()) -> Optional[Any]:
+        """
+        Load a mode file through the shared parse cache.
+        
+        Args:
+            yaml_file: Path to the YAML file
+            required_keys: Keys whose absence from the file contents rejects it unparsed
+            
+        Returns:
+            Parsed YAML content, or None if the file is missing or cannot be loaded
+        """
+        try:
+            file_stat = os.stat(yaml_file)
+        except OSError:
+            file_stat = None
+        
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            logger.debug(f"Mode file does not exist or is not a file: {yaml_file}")
+            return None
         
-        return 'discovered'
+        loaded, content = _load_yaml_file(str(yaml_file), required_keys)
+        if not loaded:
+            logger.debug(content)
+            return None
+        
+        return content
     
     def _is_valid_mode_file(self, yaml_file: Path) -> bool:
         """
@@ -171,43 +349,25 @@ class ModeDiscovery:
         Returns:
             True if valid, False otherwise
         """
-        try:
-            if not yaml_file.exists() or not yaml_file.is_file():
-                logger.debug(f"Mode file does not exist or is not a file: {yaml_file}")
-                return False
-                
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                
-            # Check if config is None or not a dictionary
-            if config is None or not isinstance(config, dict):
-                logger.debug(f"Mode file has invalid YAML structure: {yaml_file}")
-                return False
-                
-            # Basic validation - must have required fields
-            required_fields = ['slug', 'name', 'roleDefinition', 'groups']
+        config = self._load_mode_config(yaml_file, REQUIRED_MODE_FIELDS)
+        
+        # Check if config is None or not a dictionary
+        if config is None or not isinstance(config, dict):
+            logger.debug(f"Mode file has invalid YAML structure: {yaml_file}")
+            return False
             
-            for field in required_fields:
-                if field not in config:
-                    logger.debug(f"Mode file missing required field '{field}': {yaml_file}")
-                    return False
-                    
-            # Additional validation for groups field
-            if not isinstance(config['groups'], list) or not config['groups']:
-                logger.debug(f"Mode file has invalid 'groups' field: {yaml_file}")
+        # Basic validation - must have required fields
+        for field in REQUIRED_MODE_FIELDS:
+            if field not in config:
+                logger.debug(f"Mode file missing required field '{field}': {yaml_file}")
                 return False
                 
-            return True
-            
-        except yaml.YAMLError as e:
-            logger.debug(f"YAML parsing error in {yaml_file}: {str(e)}")
-            return False
-        except (FileNotFoundError, PermissionError) as e:
-            logger.debug(f"File access error for {yaml_file}: {str(e)}")
-            return False
-        except Exception as e:
-            logger.debug(f"Unexpected error validating {yaml_file}: {str(e)}")
+        # Additional validation for groups field
+        if not isinstance(config['groups'], list) or not config['groups']:
+            logger.debug(f"Mode file has invalid 'groups' field: {yaml_file}")
             return False
+            
+        return True
 
     def get_mode_count(self) -> int:
         """
@@ -249,10 +409,38 @@ class ModeDiscovery:
             }
         }
         
+    def _get_name_index(self) -> Dict[str, str]:
+        """
+        Build the lowercase display name to slug index for all discovered mode files.
+        
+        The index covers the same files as discover_all_modes(). Each file is
+        read on every call and parsed through the content-keyed parse cache,
+        so an edit is always seen, even one that keeps the file's size and
+        modification time.
+        
+        Returns:
+            Dictionary mapping lowercase mode names to mode slugs
+        """
+        name_index = {}
+        for yaml_file in sorted(self._get_yaml_files()):
+            # Files that cannot be loaded come back as None and are skipped
+            config = self._load_mode_config(yaml_file)
+            if (config and isinstance(config, dict) and
+                isinstance(config.get('name'), str)):
+                name_index.setdefault(config['name'].lower(), yaml_file.stem)
+        
+        return name_index
+    
     def find_mode_by_name(self, name: str) -> Optional[str]:
         """
         Find a mode slug by its display name (case-insensitive partial match).
         
+        Searches the same files as discover_all_modes(), so modes in
+        subdirectories are found unless the instance was created with
+        recursive=False. A case-insensitive exact match takes precedence
+        over partial matches. Both differ from earlier versions, which only
+        searched the top-level directory and returned the first partial match.
+        
         Args:
             name: The display name to search for
             
@@ -261,22 +449,20 @@ class ModeDiscovery:
         """
         if not self.modes_dir.exists() or not self.modes_dir.is_dir():
             return None
+        
+        try:
+            name_index = self._get_name_index()
+        except OSError as e:
+            logger.debug(f"Error reading modes directory {self.modes_dir}: {str(e)}")
+            return None
             
         name_lower = name.lower()
+        if name_lower in name_index:
+            return name_index[name_lower]
         
-        for yaml_file in self.modes_dir.glob("*.yaml"):
-            try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
-                    
-                if (config and isinstance(config, dict) and 
-                    'name' in config and isinstance(config['name'], str) and
-                    name_lower in config['name'].lower()):
-                    return yaml_file.stem
-                    
-            except Exception:
-                # Skip files with errors
-                continue
+        for mode_name, mode_slug in name_index.items():
+            if name_lower in mode_name:
+                return mode_slug
                 
         return None
         
@@ -313,11 +499,11 @@ class ModeDiscovery:
             return None
             
         try:
-            with open(mode_file, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                
             if not self._is_valid_mode_file(mode_file):
                 return None
+            
+            # Already parsed by the validity check, so this is a cache hit
+            config = self._load_mode_config(mode_file, REQUIRED_MODE_FIELDS)
                 
             category = self.categorize_mode(mode_slug)
             
@@ -9,9 +9,16 @@ configuration files that are not compatible with Roo's expected format.
 import yaml
 import shutil
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, Iterator, List, Tuple, Optional
 from datetime import datetime
 
+# Use the libyaml-backed loader and dumper when PyYAML was built with them.
+# Saving keeps the full Dumper so non-plain values such as tuples still serialize.
+try:
+    from yaml import CDumper as Dumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import Dumper, SafeLoader
+
 
 class GlobalConfigFixer:
     """Fixes complex group structures in global Roo configuration files."""
@@ -167,35 +174,35 @@ class GlobalConfigFixer:
             fixed_mode_config = mode_config.copy()
             
             if 'groups' in mode_config and isinstance(mode_config['groups'], list):
-                groups = mode_config['groups']
-                fixed_groups = []
-                seen_groups = set()
-                
-                for group in groups:
-                    if isinstance(group, str):
-                        # Simple group - keep as is, but avoid duplicates
-                        if group not in seen_groups:
-                            fixed_groups.append(group)
-                            seen_groups.add(group)
-                    elif isinstance(group, dict):
-                        # Complex group - extract the group name only
-                        for group_name, group_config in group.items():
-                            if group_name not in seen_groups:
-                                fixed_groups.append(group_name)
-                                seen_groups.add(group_name)
-                    else:
-                        # Other types - keep as is (shouldn't happen in valid config)
-                        if group not in seen_groups:
-                            fixed_groups.append(group)
-                            seen_groups.add(str(group))
-                
-                fixed_mode_config['groups'] = fixed_groups
+                # dict.fromkeys drops duplicates while keeping first-seen order
+                fixed_mode_config['groups'] = list(dict.fromkeys(
+                    self._iter_group_names(mode_config['groups'])
+                ))
             
             fixed_custom_modes.append(fixed_mode_config)
         
         fixed_config['customModes'] = fixed_custom_modes
         return fixed_config
     
+    @staticmethod
+    def _iter_group_names(groups: List[Any]) -> Iterator[Any]:
+        """
+        Yield the group name for each entry of a groups list.
+        
+        Args:
+            groups: Groups list mixing simple and complex group entries
+            
+        Yields:
+            Simple groups as is, the names of complex groups, and any other
+            entries unchanged (these shouldn't happen in a valid config)
+        """
+        for group in groups:
+            if isinstance(group, dict):
+                # Complex group - extract the group name only
+                yield from group
+            else:
+                yield group
+    
     def backup_config_file(self, config_path: Path) -> Path:
         """
         Create a backup of the configuration file with timestamp.
@@ -229,7 +236,7 @@ class GlobalConfigFixer:
             raise FileNotFoundError(f"Global config file not found: {config_path}")
         
         with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     
     def save_global_config(self, config_data: Dict[str, Any], config_path: Path, 
                           preserve_as_comments: bool = False, 
@@ -243,26 +250,37 @@ class GlobalConfigFixer:
             preserve_as_comments: Whether to add comments about stripped information
             stripped_info: Information about what was stripped (for comments)
         """
-        if preserve_as_comments and stripped_info:
-            # Create YAML with comments about stripped information
-            with open(config_path, 'w', encoding='utf-8') as f:
-                f.write("# Global Roo Configuration with Complex Groups Fixed\n")
-                f.write("# WARNING: The following information was stripped during fixing:\n")
-                
-                for mode_slug, mode_details in stripped_info.items():
-                    f.write(f"# Mode '{mode_slug}':\n")
-                    for detail in mode_details:
-                        group_name = detail['group_name']
-                        if detail.get('fileRegex'):
-                            f.write(f"#   - Stripped fileRegex for '{group_name}': {detail['fileRegex']}\n")
-                        if detail.get('description'):
-                            f.write(f"#   - Stripped description for '{group_name}': {detail['description']}\n")
-                
-                f.write("\n")
-                yaml.dump(config_data, f, default_flow_style=False, sort_keys=False, indent=2)
-        else:
-            with open(config_path, 'w', encoding='utf-8') as f:
-                yaml.dump(config_data, f, default_flow_style=False, sort_keys=False, indent=2)
+        with open(config_path, 'w', encoding='utf-8') as f:
+            if preserve_as_comments and stripped_info:
+                # Prefix the YAML with comments about stripped information
+                f.write(self._format_stripped_comments(stripped_info))
+            yaml.dump(config_data, f, Dumper=Dumper, default_flow_style=False, sort_keys=False, indent=2)
+    
+    def _format_stripped_comments(self, stripped_info: Dict[str, List[Dict[str, Any]]]) -> str:
+        """
+        Build the comment header describing information stripped during fixing.
+        
+        Args:
+            stripped_info: Information about what was stripped, keyed by mode slug
+            
+        Returns:
+            Comment block, ending with a blank line, to place before the YAML content
+        """
+        lines = [
+            "# Global Roo Configuration with Complex Groups Fixed",
+            "# WARNING: The following information was stripped during fixing:",
+        ]
+        
+        for mode_slug, mode_details in stripped_info.items():
+            lines.append(f"# Mode '{mode_slug}':")
+            for detail in mode_details:
+                group_name = detail['group_name']
+                if detail.get('fileRegex'):
+                    lines.append(f"#   - Stripped fileRegex for '{group_name}': {detail['fileRegex']}")
+                if detail.get('description'):
+                    lines.append(f"#   - Stripped description for '{group_name}': {detail['description']}")
+        
+        return "\n".join(lines) + "\n\n"
     
     def fix_global_config_file(self, config_path: Path, create_backup: bool = True) -> Dict[str, Any]:
         """
@@ -79,8 +79,8 @@ class ModeSync:
                        If None, will try to use ROO_MODES_DIR environment variable.
             recursive: Whether to search for modes recursively in subdirectories (default: True).
                       This parameter is passed to ModeDiscovery for file discovery behavior.
-                      When True, searches all subdirectories using rglob().
-                      When False, searches only the root directory using glob().
+                      When True, searches all subdirectories.
+                      When False, searches only the root directory.
         """
         # Get modes directory from env var if not provided
         if modes_dir is None and self.ENV_MODES_DIR in os.environ:
@@ -6,10 +6,17 @@ Mode configuration validation functionality.
 import re
 import enum
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Union, Optional
 
 
+@lru_cache(maxsize=64)
+def _compile_file_regex(pattern: str) -> "re.Pattern":
+    """Compile a group fileRegex, reusing the result for patterns already seen."""
+    return re.compile(pattern)
+
+
 class ValidationLevel(enum.Enum):
     """Validation strictness levels."""
     PERMISSIVE = 1  # Allow minor issues, collect warnings
@@ -327,7 +334,7 @@ class ModeValidator:
         
         # Check that the regex is valid
         try:
-            re.compile(file_regex)
+            _compile_file_regex(file_regex)
         except re.error:
             raise ModeValidationError(
                 f"Invalid regex pattern '{file_regex}' in {filename}"
@@ -395,7 +402,7 @@ class ModeValidator:
         
         # Check that the regex is valid
         try:
-            re.compile(file_regex)
+            _compile_file_regex(file_regex)
         except re.error:
             raise ModeValidationError(
                 f"Invalid regex pattern '{file_regex}' in {filename}"
@@ -538,33 +545,9 @@ class ModeValidator:
                 else:
                     raise YAMLStructureError(error_msg)
             
-            # Check if parsed content is a dictionary
-            if not isinstance(parsed_yaml, dict):
-                error_msg = f"YAML content must be a dictionary in {file_path}"
-                if collect_warnings:
-                    result.valid = False
-                    result.add_warning(error_msg, "error")
-                    return result
-                else:
-                    raise YAMLStructureError(error_msg)
-            
-            # Check for malformed groups structure if groups exist
-            if 'groups' in parsed_yaml and isinstance(parsed_yaml['groups'], list):
-                groups_issues = self._detect_malformed_groups_structure(parsed_yaml['groups'])
-                if groups_issues:
-                    error_msg = f"Malformed groups structure in {file_path}: {'; '.join(groups_issues)}"
-                    if collect_warnings:
-                        result.valid = False
-                        result.add_warning(error_msg, "error")
-                        return result
-                    else:
-                        raise YAMLStructureError(error_msg)
-            
-            # If we get here, YAML structure is valid
-            if collect_warnings:
-                return result
-            else:
-                return True
+            return self.validate_yaml_structure_from_dict(
+                parsed_yaml, file_path, collect_warnings=collect_warnings
+            )
                 
         except (IOError, OSError) as e:
             error_msg = f"Error reading file {file_path}: {str(e)}"
@@ -575,6 +558,53 @@ class ModeValidator:
             else:
                 raise YAMLStructureError(error_msg)
     
+    def validate_yaml_structure_from_dict(self, parsed_yaml: Any, source: str = "<memory>",
+                                          collect_warnings: bool = False) -> Union[bool, ValidationResult]:
+        """
+        Validate the structure of already-parsed mode YAML, without touching the filesystem.
+        
+        Args:
+            parsed_yaml: Parsed YAML content
+            source: Name used in error messages, usually the originating file path
+            collect_warnings: If True, return ValidationResult with warnings
+            
+        Returns:
+            If collect_warnings is False: True if valid
+            If collect_warnings is True: ValidationResult object
+            
+        Raises:
+            YAMLStructureError: If YAML structure validation fails
+        """
+        result = ValidationResult(valid=True)
+        
+        # Check if parsed content is a dictionary
+        if not isinstance(parsed_yaml, dict):
+            error_msg = f"YAML content must be a dictionary in {source}"
+            if collect_warnings:
+                result.valid = False
+                result.add_warning(error_msg, "error")
+                return result
+            else:
+                raise YAMLStructureError(error_msg)
+        
+        # Check for malformed groups structure if groups exist
+        if 'groups' in parsed_yaml and isinstance(parsed_yaml['groups'], list):
+            groups_issues = self._detect_malformed_groups_structure(parsed_yaml['groups'])
+            if groups_issues:
+                error_msg = f"Malformed groups structure in {source}: {'; '.join(groups_issues)}"
+                if collect_warnings:
+                    result.valid = False
+                    result.add_warning(error_msg, "error")
+                    return result
+                else:
+                    raise YAMLStructureError(error_msg)
+        
+        # If we get here, YAML structure is valid
+        if collect_warnings:
+            return result
+        else:
+            return True
+    
     def _detect_malformed_groups_structure(self, groups: List[Any]) -> List[str]:
         """
         Detect malformed groups structure, specifically double-nested arrays.
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+YAML helpers for tests, backed by libyaml when PyYAML was built with it.
+"""
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+
+def dump(data, stream=None):
+    """Serialize data as YAML to stream, or return it as a string when no stream is given."""
+    return yaml.dump(data, stream, Dumper=SafeDumper)
+
+
+def dump_all(documents, stream=None):
+    """Serialize documents as a multi-document YAML stream, or return it as a string."""
+    return yaml.dump_all(documents, stream, Dumper=SafeDumper)
+
+
+def load(stream):
+    """Parse a YAML document from a string or file object."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_all(stream):
+    """Lazily parse every document in a multi-document YAML string or file object."""
+    return yaml.load_all(stream, Loader=SafeLoader)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the roo_modes_sync test suite.
+"""
+
+import copy
+import shutil
+import sys
+
+import pytest
+
+from roo_modes_sync.core.backup import BackupManager
+from roo_modes_sync.core.discovery import _load_yaml_cached
+from roo_modes_sync.core.validation import _compile_file_regex
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """Import PyYAML and the CLI up front so first-import cost stays out of test durations."""
+    import yaml  # noqa: F401
+    try:
+        import roo_modes_sync.cli  # noqa: F401
+    except Exception:
+        # A broken cli must only affect the modules that importorskip it
+        pass
+
+
+@pytest.fixture(autouse=True)
+def _clear_memoized_functions():
+    """Start every test with empty process-wide caches so results never leak between tests."""
+    _load_yaml_cached.cache_clear()
+    _compile_file_regex.cache_clear()
+
+    # cli is only imported when it loads cleanly; see _warmup
+    cli = sys.modules.get("roo_modes_sync.cli")
+    if cli is not None:
+        cli._script_relative_modes_dir.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def _baseline_project(tmp_path_factory):
+    """Write the baseline project files once per session."""
+    project_dir = tmp_path_factory.mktemp("baseline")
+
+    # Create test .roomodes file
+    (project_dir / ".roomodes").write_text("test local roomodes content")
+
+    # Create test global.roomodes file
+    (project_dir / "global.roomodes").write_text("test global roomodes content")
+
+    # Create test custom_modes.yaml file
+    (project_dir / "custom_modes.yaml").write_text("customModes: []")
+
+    return project_dir
+
+
+@pytest.fixture
+def temp_project_dir(_baseline_project, tmp_path):
+    """Provide a per-test copy of the baseline project directory."""
+    for baseline_file in _baseline_project.iterdir():
+        shutil.copy(baseline_file, tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def _prebuilt_backups(_baseline_project, tmp_path_factory):
+    """Build a project with one local, global and custom_modes backup, once per session."""
+    project_dir = tmp_path_factory.mktemp("prebuilt") / "project"
+    shutil.copytree(_baseline_project, project_dir)
+
+    backup_manager = BackupManager(project_dir)
+    backup_manager.backup_local_roomodes()
+    backup_manager.backup_global_roomodes()
+    backup_manager.backup_custom_modes()
+
+    return project_dir
+
+
+@pytest.fixture
+def seeded_project(_prebuilt_backups, tmp_path):
+    """Provide a per-test copy of the project with pre-existing backups."""
+    project_dir = tmp_path / "project"
+    shutil.copytree(_prebuilt_backups, project_dir)
+    return project_dir
+
+
+@pytest.fixture(scope="module")
+def temp_modes_dir(tmp_path_factory):
+    """Create a read-only modes directory with a single test mode, once per module."""
+    modes_dir = tmp_path_factory.mktemp("modes_root") / "modes"
+    modes_dir.mkdir()
+
+    # Create a test mode file
+    (modes_dir / "test.yaml").write_text(
+        "slug: test\n"
+        "name: Test Mode\n"
+        "roleDefinition: A test mode for testing\n"
+        "groups:\n"
+        "  - edit\n"
+        "source: global\n"
+    )
+    return modes_dir
+
+
+@pytest.fixture(scope="session")
+def mcp_modes_dir(tmp_path_factory):
+    """Create the modes directory served by the shared MCP server, once per session."""
+    modes_dir = tmp_path_factory.mktemp("mcp_project") / "modes"
+    modes_dir.mkdir()
+
+    # Create a test mode file
+    (modes_dir / "test-mode.yaml").write_text(
+        "slug: test-mode\n"
+        "name: Test Mode\n"
+        "groups:\n"
+        "  - edit\n"
+        "  - ask\n"
+    )
+    return modes_dir
+
+
+@pytest.fixture(scope="session")
+def _base_mcp_server(mcp_modes_dir):
+    """Construct the MCP server, with its ModeSync and BackupManager, once per session."""
+    from roo_modes_sync.mcp import ModesMCPServer
+
+    return ModesMCPServer(mcp_modes_dir)
+
+
+@pytest.fixture
+def mcp_server(_base_mcp_server):
+    """Provide a per-test shallow copy of the session MCP server.
+
+    Only the server object is copied: every copy shares the session's
+    ModeSync (``sync``) and BackupManager (``backup_manager``). Tests may
+    rebind attributes on their copy, but must not mutate the shared
+    managers in place, e.g. by assigning to ``mcp_server.sync.<attr>`` or
+    writing into ``mcp_server.modes_dir``. Patch manager methods with
+    patch.object, which restores the originals when each test finishes.
+    A test that needs to change manager state should build its own
+    ModesMCPServer instead.
+    """
+    return copy.copy(_base_mcp_server)
@@ -6,83 +6,31 @@ Tests the command line interface including backup, restore, and list-backups com
 """
 
 import pytest
-import tempfile
-import sys
 from pathlib import Path
+from types import SimpleNamespace as NS
 from unittest.mock import patch
 
-# Add the parent directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from roo_modes_sync.core.backup import BackupManager
 
-# Import BackupManager and exceptions with fallback mechanism
-try:
-    from core.backup import BackupManager, BackupError
-    from exceptions import SyncError
-except ImportError:
-    # If direct import fails, add core directory to path
-    core_dir = Path(__file__).parent.parent / "core"
-    sys.path.insert(0, str(core_dir))
-    from backup import BackupManager
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-
-# Import CLI functions with fallback mechanism
-try:
-    from cli import (
-        main, backup_files, restore_files, list_backups,
-        sync_global, sync_local, list_modes, serve_mcp
-    )
-except ImportError:
-    # Fallback: mock the CLI functions for testing
-    def main():
-        return 0
-    def backup_files(args):
-        return 0
-    def restore_files(args):
-        return 0
-    def list_backups(args):
-        return 0
-    def sync_global(args):
-        return 0
-    def sync_local(args):
-        return 0
-    def list_modes(args):
-        return 0
-    def serve_mcp(args):
-        return 0
+cli = pytest.importorskip("roo_modes_sync.cli")
+from roo_modes_sync.cli import (  # noqa: E402
+    main, backup_files, restore_files, list_backups,
+    sync_global, sync_local, list_modes, serve_mcp
+)
 
 
 class TestCLIBackupCommands:
     """Test CLI backup-related commands."""
     
     @pytest.fixture
-    def temp_project_dir(self):
-        """Create a temporary project directory with test files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_dir = Path(temp_dir)
-            
-            # Create test .roomodes file
-            roomodes_file = project_dir / ".roomodes"
-            roomodes_file.write_text("test local roomodes content")
-            
-            # Create test global.roomodes file
-            global_roomodes = project_dir / "global.roomodes"
-            global_roomodes.write_text("test global roomodes content")
-            
-            # Create test custom_modes.yaml file
-            custom_modes = project_dir / "custom_modes.yaml"
-            custom_modes.write_text("customModes: []")
-            
-            yield project_dir
+    def backup_mgr(self, temp_project_dir):
+        """Create a BackupManager for the test project."""
+        return BackupManager(temp_project_dir)
     
-    def test_backup_files_all_types(self, temp_project_dir, monkeypatch, capsys):
+    def test_backup_files_all_types(self, temp_project_dir, capfd):
         """Test backing up all file types."""
-        # Mock sys.argv
-        test_args = ["cli.py", "backup", "--type", "all", "--project-dir", str(temp_project_dir)]
-        monkeypatch.setattr(sys, "argv", test_args)
-        
-        # Create argparse Namespace object
-        import argparse
-        args = argparse.Namespace(
+        # Create the parsed-arguments namespace
+        args = NS(
             type="all",
             project_dir=str(temp_project_dir)
         )
@@ -94,14 +42,13 @@ class TestCLIBackupCommands:
         assert result == 0
         
         # Check output
-        captured = capsys.readouterr()
+        captured = capfd.readouterr()
         assert "backed up to:" in captured.out
         assert "backup(s) created successfully" in captured.out
     
-    def test_backup_files_local_only(self, temp_project_dir, monkeypatch, capsys):
+    def test_backup_files_local_only(self, temp_project_dir, capfd):
         """Test backing up local files only."""
-        import argparse
-        args = argparse.Namespace(
+        args = NS(
             type="local",
             project_dir=str(temp_project_dir)
         )
@@ -109,13 +56,12 @@ class TestCLIBackupCommands:
         result = backup_files(args)
         assert result == 0
         
-        captured = capsys.readouterr()
+        captured = capfd.readouterr()
         assert "Local .roomodes backed up" in captured.out
     
-    def test_backup_files_global_only(self, temp_project_dir, monkeypatch, capsys):
+    def test_backup_files_global_only(self, temp_project_dir, capfd):
         """Test backing up global files only."""
-        import argparse
-        args = argparse.Namespace(
+        args = NS(
             type="global",
             project_dir=str(temp_project_dir)
         )
@@ -123,53 +69,42 @@ class TestCLIBackupCommands:
         result = backup_files(args)
         assert result == 0
         
-        captured = capsys.readouterr()
+        captured = capfd.readouterr()
         assert "Global .roomodes backed up" in captured.out or "custom_modes.yaml backed up" in captured.out
     
-    def test_backup_files_no_files(self, monkeypatch, capsys):
+    def test_backup_files_no_files(self, tmp_path, capfd):
         """Test backup when no files exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            import argparse
-            args = argparse.Namespace(
-                type="all",
-                project_dir=temp_dir
-            )
-            
-            backup_files(args)
-            
-            # Should still return 1 since no backups were created
-            captured = capsys.readouterr()
-            assert "backup failed" in captured.out or "No backups were created" in captured.out
+        args = NS(
+            type="all",
+            project_dir=str(tmp_path)
+        )
+        
+        backup_files(args)
+        
+        # Should still return 1 since no backups were created
+        captured = capfd.readouterr()
+        assert "backup failed" in captured.out or "No backups were created" in captured.out
     
-    def test_restore_files_latest(self, temp_project_dir, capsys):
+    def test_restore_files_latest(self, seeded_project, capfd):
         """Test restoring latest backup files."""
-        # First create some backups
-        backup_manager = BackupManager(temp_project_dir)
-        backup_manager.backup_local_roomodes()
-        backup_manager.backup_global_roomodes()
-        backup_manager.backup_custom_modes()
-        
-        import argparse
-        args = argparse.Namespace(
+        args = NS(
             type="all",
-            project_dir=str(temp_project_dir),
+            project_dir=str(seeded_project),
             backup_file=None
         )
         
         result = restore_files(args)
         assert result == 0
         
-        captured = capsys.readouterr()
+        captured = capfd.readouterr()
         assert "Restored" in captured.out
     
-    def test_restore_files_specific_backup(self, temp_project_dir, capsys):
+    def test_restore_files_specific_backup(self, temp_project_dir, backup_mgr, capfd):
         """Test restoring a specific backup file."""
         # First create a backup
-        backup_manager = BackupManager(temp_project_dir)
-        backup_path = backup_manager.backup_local_roomodes()
+        backup_path = backup_mgr.backup_local_roomodes()
         
-        import argparse
-        args = argparse.Namespace(
+        args = NS(
             type="all",
             project_dir=str(temp_project_dir),
             backup_file=str(backup_path)
@@ -178,13 +113,12 @@ class TestCLIBackupCommands:
         result = restore_files(args)
         assert result == 0
         
-        captured = capsys.readouterr()
+        captured = capfd.readouterr()
         assert "Restored local .roomodes" in captured.out
     
-    def test_restore_files_nonexistent_backup(self, temp_project_dir, capsys):
+    def test_restore_files_nonexistent_backup(self, temp_project_dir, capfd):
         """Test restoring when no backups exist."""
-        import argparse
-        args = argparse.Namespace(
+        args = NS(
             type="all",
             project_dir=str(temp_project_dir),
             backup_file=None
@@ -193,69 +127,41 @@ class TestCLIBackupCommands:
         restore_files(args)
         
         # Should return 1 since no files were restored
-        captured = capsys.readouterr()
+        captured = capfd.readouterr()
         assert "restore failed" in captured.out or "No files were restored" in captured.out
     
-    def test_list_backups_with_files(self, temp_project_dir, capsys):
+    def test_list_backups_with_files(self, seeded_project, capfd):
         """Test listing backups when files exist."""
-        # Create some backups
-        backup_manager = BackupManager(temp_project_dir)
-        backup_manager.backup_local_roomodes()
-        backup_manager.backup_global_roomodes()
-        
-        import argparse
-        args = argparse.Namespace(
-            project_dir=str(temp_project_dir)
+        args = NS(
+            project_dir=str(seeded_project)
         )
         
         result = list_backups(args)
         assert result == 0
         
-        captured = capsys.readouterr()
+        captured = capfd.readouterr()
         assert "Available backups" in captured.out
         assert "Total:" in captured.out
     
-    def test_list_backups_no_files(self, capsys):
+    def test_list_backups_no_files(self, tmp_path, capfd):
         """Test listing backups when no files exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            import argparse
-            args = argparse.Namespace(
-                project_dir=temp_dir
-            )
-            
-            result = list_backups(args)
-            assert result == 0
-            
-            captured = capsys.readouterr()
-            assert "No backups found" in captured.out
+        args = NS(
+            project_dir=str(tmp_path)
+        )
+        
+        result = list_backups(args)
+        assert result == 0
+        
+        captured = capfd.readouterr()
+        assert "No backups found" in captured.out
 
 
 class TestCLISyncCommands:
     """Test CLI sync commands."""
     
-    @pytest.fixture
-    def temp_modes_dir(self):
-        """Create a temporary modes directory with test files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            modes_dir = Path(temp_dir) / "modes"
-            modes_dir.mkdir()
-            
-            # Create a test mode file
-            test_mode = modes_dir / "test.yaml"
-            test_mode.write_text("""
-slug: test
-name: Test Mode
-roleDefinition: A test mode for testing
-groups:
-  - edit
-source: global
-""")
-            yield modes_dir
-    
-    def test_sync_global_dry_run(self, temp_modes_dir, capsys):
+    def test_sync_global_dry_run(self, temp_modes_dir, capfd):
         """Test global sync with dry run."""
-        import argparse
-        args = argparse.Namespace(
+        args = NS(
             modes_dir=temp_modes_dir,
             config=None,
             strategy="strategic",
@@ -266,38 +172,35 @@ source: global
         result = sync_global(args)
         assert result == 0
         
-        captured = capsys.readouterr()
+        captured = capfd.readouterr()
         assert "would be synchronized" in captured.out
     
-    def test_sync_local_dry_run(self, temp_modes_dir, capsys):
+    def test_sync_local_dry_run(self, tmp_path, temp_modes_dir, capfd):
         """Test local sync with dry run."""
-        with tempfile.TemporaryDirectory() as temp_project:
-            import argparse
-            args = argparse.Namespace(
-                modes_dir=temp_modes_dir,
-                project_dir=temp_project,
-                strategy="strategic",
-                dry_run=True,
-                no_backup=False
-            )
-            
-            result = sync_local(args)
-            assert result == 0
-            
-            captured = capsys.readouterr()
-            assert "would be synchronized" in captured.out
+        args = NS(
+            modes_dir=temp_modes_dir,
+            project_dir=str(tmp_path),
+            strategy="strategic",
+            dry_run=True,
+            no_backup=False
+        )
+        
+        result = sync_local(args)
+        assert result == 0
+        
+        captured = capfd.readouterr()
+        assert "would be synchronized" in captured.out
     
-    def test_list_modes(self, temp_modes_dir, capsys):
+    def test_list_modes(self, temp_modes_dir, capfd):
         """Test listing modes."""
-        import argparse
-        args = argparse.Namespace(
+        args = NS(
             modes_dir=temp_modes_dir
         )
         
         result = list_modes(args)
         assert result == 0
         
-        captured = capsys.readouterr()
+        captured = capfd.readouterr()
         assert "Found" in captured.out
         assert "modes in" in captured.out
 
@@ -305,234 +208,119 @@ source: global
 class TestCLIMainFunction:
     """Test main CLI function with argument parsing."""
     
-    def test_main_backup_command(self, monkeypatch):
-        """Test main function with backup command."""
-        test_args = ["cli.py", "backup", "--type", "local"]
-        monkeypatch.setattr(sys, "argv", test_args)
-        
-        # Mock the backup_files function
-        with patch('cli.backup_files') as mock_backup:
-            mock_backup.return_value = 0
-            result = main()
+    @pytest.mark.parametrize("argv, target", [
+        (["backup", "--type", "local"], "roo_modes_sync.cli.backup_files"),
+        (["restore", "--type", "all"], "roo_modes_sync.cli.restore_files"),
+        (["list-backups"], "roo_modes_sync.cli.list_backups"),
+        (["sync-global", "--dry-run"], "roo_modes_sync.cli.sync_global"),
+        (["sync-local", "/tmp/test", "--dry-run"], "roo_modes_sync.cli.sync_local"),
+        (["list"], "roo_modes_sync.cli.list_modes"),
+        (["serve"], "roo_modes_sync.cli.serve_mcp"),
+    ], ids=["backup", "restore", "list-backups", "sync-global", "sync-local", "list", "serve"])
+    def test_main_dispatches_command(self, argv, target):
+        """Test main function dispatches each command to its handler."""
+        with patch(target, return_value=0) as mock_command:
+            result = main(argv)
             assert result == 0
-            mock_backup.assert_called_once()
-    
-    def test_main_restore_command(self, monkeypatch):
-        """Test main function with restore command."""
-        test_args = ["cli.py", "restore", "--type", "all"]
-        monkeypatch.setattr(sys, "argv", test_args)
-        
-        with patch('cli.restore_files') as mock_restore:
-            mock_restore.return_value = 0
-            result = main()
-            assert result == 0
-            mock_restore.assert_called_once()
-    
-    def test_main_list_backups_command(self, monkeypatch):
-        """Test main function with list-backups command."""
-        test_args = ["cli.py", "list-backups"]
-        monkeypatch.setattr(sys, "argv", test_args)
-        
-        with patch('cli.list_backups') as mock_list:
-            mock_list.return_value = 0
-            result = main()
-            assert result == 0
-            mock_list.assert_called_once()
-    
-    def test_main_sync_global_command(self, monkeypatch):
-        """Test main function with sync-global command."""
-        test_args = ["cli.py", "sync-global", "--dry-run"]
-        monkeypatch.setattr(sys, "argv", test_args)
-        
-        with patch('cli.sync_global') as mock_sync:
-            mock_sync.return_value = 0
-            result = main()
-            assert result == 0
-            mock_sync.assert_called_once()
-    
-    def test_main_sync_local_command(self, monkeypatch):
-        """Test main function with sync-local command."""
-        test_args = ["cli.py", "sync-local", "/tmp/test", "--dry-run"]
-        monkeypatch.setattr(sys, "argv", test_args)
-        
-        with patch('cli.sync_local') as mock_sync:
-            mock_sync.return_value = 0
-            result = main()
-            assert result == 0
-            mock_sync.assert_called_once()
-    
-    def test_main_list_command(self, monkeypatch):
-        """Test main function with list command."""
-        test_args = ["cli.py", "list"]
-        monkeypatch.setattr(sys, "argv", test_args)
-        
-        with patch('cli.list_modes') as mock_list:
-            mock_list.return_value = 0
-            result = main()
-            assert result == 0
-            mock_list.assert_called_once()
-    
-    def test_main_serve_command(self, monkeypatch):
-        """Test main function with serve command."""
-        test_args = ["cli.py", "serve"]
-        monkeypatch.setattr(sys, "argv", test_args)
-        
-        with patch('cli.serve_mcp') as mock_serve:
-            mock_serve.return_value = 0
-            result = main()
-            assert result == 0
-            mock_serve.assert_called_once()
+            mock_command.assert_called_once()
 
 
 class TestCLIErrorHandling:
     """Test CLI error handling."""
     
-    def test_backup_files_exception_handling(self, capsys):
-        """Test backup files with exception."""
-        import argparse
-        args = argparse.Namespace(
-            type="all",
-            project_dir="/nonexistent/directory"
-        )
-        
-        result = backup_files(args)
+    @pytest.mark.parametrize("func, kwargs, expected", [
+        (backup_files,
+         {"type": "all", "project_dir": "/nonexistent/directory"},
+         "Backup operation failed"),
+        (restore_files,
+         {"type": "all", "project_dir": "/nonexistent/directory", "backup_file": None},
+         "Restore operation failed"),
+        (list_backups,
+         {"project_dir": "/nonexistent/directory"},
+         "Error listing backups"),
+        (sync_global,
+         {"modes_dir": Path("/nonexistent"), "config": None, "strategy": "strategic",
+          "dry_run": False, "no_backup": False},
+         "Error:"),
+        (sync_local,
+         {"modes_dir": Path("/nonexistent"), "project_dir": "/nonexistent", "strategy": "strategic",
+          "dry_run": False, "no_backup": False},
+         "Error:"),
+    ], ids=["backup_files", "restore_files", "list_backups", "sync_global", "sync_local"])
+    def test_command_error_handling(self, capfd, func, kwargs, expected):
+        """Test that commands report failures and return a non-zero exit code."""
+        result = func(NS(**kwargs))
         assert result == 1
         
-        captured = capsys.readouterr()
-        assert "Backup operation failed" in captured.out
+        captured = capfd.readouterr()
+        assert expected in captured.out
+
+
+class TestCLIIntegration:
+    """Integration tests for CLI functionality."""
     
-    def test_restore_files_exception_handling(self, capsys):
-        """Test restore files with exception."""
-        import argparse
-        args = argparse.Namespace(
-            type="all",
-            project_dir="/nonexistent/directory",
-            backup_file=None
-        )
+    def test_full_backup_restore_cycle(self, tmp_path, capfd):
+        """Test a complete backup and restore cycle."""
+        project_dir = tmp_path
         
-        result = restore_files(args)
-        assert result == 1
+        # Create initial files
+        roomodes_file = project_dir / ".roomodes"
+        roomodes_file.write_text("original content")
         
-        captured = capsys.readouterr()
-        assert "Restore operation failed" in captured.out
-    
-    def test_list_backups_exception_handling(self, capsys):
-        """Test list backups with exception."""
-        import argparse
-        args = argparse.Namespace(
-            project_dir="/nonexistent/directory"
+        # Test backup
+        backup_args = NS(
+            type="local",
+            project_dir=str(project_dir)
         )
         
-        result = list_backups(args)
-        assert result == 1
+        backup_result = backup_files(backup_args)
+        assert backup_result == 0
         
-        captured = capsys.readouterr()
-        assert "Error listing backups" in captured.out
-    
-    def test_sync_global_sync_error(self, capsys):
-        """Test sync global with sync error."""
-        import argparse
-        args = argparse.Namespace(
-            modes_dir=Path("/nonexistent"),
-            config=None,
-            strategy="strategic",
-            dry_run=False,
-            no_backup=False
+        # Modify original file
+        roomodes_file.write_text("modified content")
+        
+        # Test restore
+        restore_args = NS(
+            type="local",
+            project_dir=str(project_dir),
+            backup_file=None
         )
         
-        result = sync_global(args)
-        assert result == 1
+        restore_result = restore_files(restore_args)
+        assert restore_result == 0
         
-        captured = capsys.readouterr()
-        assert "Error:" in captured.out
+        # Verify restoration
+        restored_content = roomodes_file.read_text()
+        assert restored_content == "original content"
     
-    def test_sync_local_sync_error(self, capsys):
-        """Test sync local with sync error."""
-        import argparse
-        args = argparse.Namespace(
-            modes_dir=Path("/nonexistent"),
-            project_dir="/nonexistent",
-            strategy="strategic",
-            dry_run=False,
-            no_backup=False
+    def test_backup_numbering_sequence(self, tmp_path, capfd):
+        """Test that backup numbering works correctly."""
+        project_dir = tmp_path
+        
+        # Create initial file
+        roomodes_file = project_dir / ".roomodes"
+        roomodes_file.write_text("content 1")
+        
+        backup_args = NS(
+            type="local",
+            project_dir=str(project_dir)
         )
         
-        result = sync_local(args)
-        assert result == 1
+        # Create multiple backups
+        for i in range(3):
+            roomodes_file.write_text(f"content {i+1}")
+            result = backup_files(backup_args)
+            assert result == 0
         
-        captured = capsys.readouterr()
-        assert "Error:" in captured.out
-
-
-class TestCLIIntegration:
-    """Integration tests for CLI functionality."""
-    
-    def test_full_backup_restore_cycle(self, capsys):
-        """Test a complete backup and restore cycle."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_dir = Path(temp_dir)
-            
-            # Create initial files
-            roomodes_file = project_dir / ".roomodes"
-            roomodes_file.write_text("original content")
-            
-            # Test backup
-            import argparse
-            backup_args = argparse.Namespace(
-                type="local",
-                project_dir=str(project_dir)
-            )
-            
-            backup_result = backup_files(backup_args)
-            assert backup_result == 0
-            
-            # Modify original file
-            roomodes_file.write_text("modified content")
-            
-            # Test restore
-            restore_args = argparse.Namespace(
-                type="local",
-                project_dir=str(project_dir),
-                backup_file=None
-            )
-            
-            restore_result = restore_files(restore_args)
-            assert restore_result == 0
-            
-            # Verify restoration
-            restored_content = roomodes_file.read_text()
-            assert restored_content == "original content"
-    
-    def test_backup_numbering_sequence(self, capsys):
-        """Test that backup numbering works correctly."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_dir = Path(temp_dir)
-            
-            # Create initial file
-            roomodes_file = project_dir / ".roomodes"
-            roomodes_file.write_text("content 1")
-            
-            import argparse
-            backup_args = argparse.Namespace(
-                type="local",
-                project_dir=str(project_dir)
-            )
-            
-            # Create multiple backups
-            for i in range(3):
-                roomodes_file.write_text(f"content {i+1}")
-                result = backup_files(backup_args)
-                assert result == 0
-            
-            # List backups to verify numbering
-            list_args = argparse.Namespace(project_dir=str(project_dir))
-            list_result = list_backups(list_args)
-            assert list_result == 0
-            
-            captured = capsys.readouterr()
-            assert ".roomodes_1" in captured.out
-            assert ".roomodes_2" in captured.out
-            assert ".roomodes_3" in captured.out
+        # List backups to verify numbering
+        list_args = NS(project_dir=str(project_dir))
+        list_result = list_backups(list_args)
+        assert list_result == 0
+        
+        captured = capfd.readouterr()
+        assert ".roomodes_1" in captured.out
+        assert ".roomodes_2" in captured.out
+        assert ".roomodes_3" in captured.out
 
 
 if __name__ == "__main__":
@@ -2,106 +2,62 @@
 """
 Integration tests for CLI functionality.
 
-Tests the command line interface by actually calling the CLI as a subprocess.
+Tests the command line interface by running the CLI entry point in-process.
 """
 
 import pytest
-import tempfile
-import subprocess
-import sys
-from pathlib import Path
 
-# Add the parent directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-# Import BackupManager with fallback mechanism
-try:
-    from core.backup import BackupManager
-except ImportError:
-    # If direct import fails, add core directory to path
-    core_dir = Path(__file__).parent.parent / "core"
-    sys.path.insert(0, str(core_dir))
-    from backup import BackupManager
+from roo_modes_sync.core.backup import BackupManager
+from roo_modes_sync.cli import build_parser, main
 
 
 class TestCLIIntegration:
     """Integration tests for CLI commands."""
     
-    @pytest.fixture
-    def temp_project_dir(self):
-        """Create a temporary project directory with test files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_dir = Path(temp_dir)
-            
-            # Create test .roomodes file
-            roomodes_file = project_dir / ".roomodes"
-            roomodes_file.write_text("test local roomodes content")
-            
-            # Create test global.roomodes file
-            global_roomodes = project_dir / "global.roomodes"
-            global_roomodes.write_text("test global roomodes content")
-            
-            # Create test custom_modes.yaml file
-            custom_modes = project_dir / "custom_modes.yaml"
-            custom_modes.write_text("customModes: []")
-            
-            yield project_dir
-    
-    @pytest.fixture
-    def cli_script(self):
-        """Get path to CLI script."""
-        return Path(__file__).parent.parent / "cli.py"
+    @staticmethod
+    def _help_output(command, capfd):
+        """Parse '<command> --help' and return the help text argparse prints."""
+        with pytest.raises(SystemExit) as exc_info:
+            build_parser().parse_args([command, "--help"])
+        
+        assert exc_info.value.code == 0
+        return capfd.readouterr().out
     
-    def test_cli_backup_help(self, cli_script):
+    def test_cli_backup_help(self, capfd):
         """Test CLI backup help command."""
-        result = subprocess.run([
-            sys.executable, str(cli_script), "backup", "--help"
-        ], capture_output=True, text=True)
-        
-        assert result.returncode == 0
-        assert "Create backups of configuration files" in result.stdout
+        assert "Create backups of configuration files" in self._help_output("backup", capfd)
     
-    def test_cli_restore_help(self, cli_script):
+    def test_cli_restore_help(self, capfd):
         """Test CLI restore help command."""
-        result = subprocess.run([
-            sys.executable, str(cli_script), "restore", "--help"
-        ], capture_output=True, text=True)
-        
-        assert result.returncode == 0
-        assert "Restore configuration files from backup" in result.stdout
+        assert "Restore configuration files from backup" in self._help_output("restore", capfd)
     
-    def test_cli_list_backups_help(self, cli_script):
+    def test_cli_list_backups_help(self, capfd):
         """Test CLI list-backups help command."""
-        result = subprocess.run([
-            sys.executable, str(cli_script), "list-backups", "--help"
-        ], capture_output=True, text=True)
-        
-        assert result.returncode == 0
-        assert "List available backup files" in result.stdout
+        assert "List available backup files" in self._help_output("list-backups", capfd)
     
-    def test_cli_backup_local_type(self, cli_script, temp_project_dir):
+    def test_cli_backup_local_type(self, temp_project_dir, capfd):
         """Test CLI backup with local type."""
-        result = subprocess.run([
-            sys.executable, str(cli_script), "backup",
+        result = main([
+            "backup",
             "--type", "local",
             "--project-dir", str(temp_project_dir)
-        ], capture_output=True, text=True)
+        ])
         
-        # Should succeed or have expected failure message
-        assert "backed up" in result.stdout or "backup failed" in result.stdout
+        # The project has a .roomodes file, so the backup succeeds
+        assert result == 0
+        assert "backed up" in capfd.readouterr().out
     
-    def test_cli_list_backups_empty(self, cli_script):
+    def test_cli_list_backups_empty(self, tmp_path, capfd):
         """Test CLI list-backups with no backups."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = subprocess.run([
-                sys.executable, str(cli_script), "list-backups",
-                "--project-dir", temp_dir
-            ], capture_output=True, text=True)
-            
-            assert result.returncode == 0
-            assert "No backups found" in result.stdout
+        result = main([
+            "list-backups",
+            "--project-dir", str(tmp_path)
+        ])
+        
+        assert result == 0
+        assert "No backups found" in capfd.readouterr().out
     
-    def test_cli_full_backup_restore_cycle(self, cli_script, temp_project_dir):
+    def test_cli_full_backup_restore_cycle(self, temp_project_dir, capfd):
         """Test complete backup and restore cycle via CLI."""
         original_content = "original test content"
         modified_content = "modified test content"
@@ -111,127 +67,121 @@ class TestCLIIntegration:
         roomodes_file.write_text(original_content)
         
         # Step 1: Create backup
-        backup_result = subprocess.run([
-            sys.executable, str(cli_script), "backup",
+        main([
+            "backup",
             "--type", "local",
             "--project-dir", str(temp_project_dir)
-        ], capture_output=True, text=True)
+        ])
+        backup_output = capfd.readouterr().out
         
         # Step 2: Modify file
         roomodes_file.write_text(modified_content)
         assert roomodes_file.read_text() == modified_content
         
         # Step 3: List backups
-        subprocess.run([
-            sys.executable, str(cli_script), "list-backups",
+        main([
+            "list-backups",
             "--project-dir", str(temp_project_dir)
-        ], capture_output=True, text=True)
+        ])
+        capfd.readouterr()
         
         # Step 4: Restore backup
-        restore_result = subprocess.run([
-            sys.executable, str(cli_script), "restore",
+        main([
+            "restore",
             "--type", "local",
             "--project-dir", str(temp_project_dir)
-        ], capture_output=True, text=True)
+        ])
+        restore_output = capfd.readouterr().out
         
-        # Verify restore worked (if backup was successful)
-        if "backed up" in backup_result.stdout:
-            if "Restored" in restore_result.stdout:
-                restored_content = roomodes_file.read_text()
-                assert restored_content == original_content
+        # Verify the backup and restore both ran and the content came back
+        assert "backed up" in backup_output
+        assert "Restored" in restore_output
+        assert roomodes_file.read_text() == original_content
 
 
 class TestCLIErrorHandling:
     """Test CLI error handling scenarios."""
     
-    @pytest.fixture
-    def cli_script(self):
-        """Get path to CLI script."""
-        return Path(__file__).parent.parent / "cli.py"
-    
-    def test_cli_backup_nonexistent_directory(self, cli_script):
+    def test_cli_backup_nonexistent_directory(self, capfd):
         """Test backup with nonexistent directory."""
-        result = subprocess.run([
-            sys.executable, str(cli_script), "backup",
+        result = main([
+            "backup",
             "--project-dir", "/nonexistent/directory"
-        ], capture_output=True, text=True)
+        ])
         
         # Should handle error gracefully
-        assert result.returncode != 0 or "failed" in result.stdout
+        assert result != 0 or "failed" in capfd.readouterr().out
     
-    def test_cli_restore_no_backups(self, cli_script):
+    def test_cli_restore_no_backups(self, tmp_path, capfd):
         """Test restore when no backups exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = subprocess.run([
-                sys.executable, str(cli_script), "restore",
-                "--project-dir", temp_dir
-            ], capture_output=True, text=True)
-            
-            # Should handle gracefully
-            assert "failed" in result.stdout or "No files were restored" in result.stdout
+        main([
+            "restore",
+            "--project-dir", str(tmp_path)
+        ])
+        
+        # Should handle gracefully
+        captured = capfd.readouterr()
+        assert "failed" in captured.out or "No files were restored" in captured.out
     
-    def test_cli_invalid_command(self, cli_script):
+    def test_cli_invalid_command(self):
         """Test invalid CLI command."""
-        result = subprocess.run([
-            sys.executable, str(cli_script), "invalid-command"
-        ], capture_output=True, text=True)
+        with pytest.raises(SystemExit) as exc_info:
+            main(["invalid-command"])
         
-        assert result.returncode != 0
+        assert exc_info.value.code != 0
 
 
 class TestCLIBackupManager:
     """Test CLI integration with BackupManager functionality."""
     
-    def test_backup_manager_integration_via_cli(self):
+    def test_backup_manager_integration_via_cli(self, tmp_path):
         """Test that CLI properly uses BackupManager."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_dir = Path(temp_dir)
-            
-            # Create test files
-            roomodes_file = project_dir / ".roomodes"
-            roomodes_file.write_text("test content")
-            
-            # Use BackupManager directly to create backup
-            backup_manager = BackupManager(project_dir)
-            backup_path = backup_manager.backup_local_roomodes()
-            
-            # Verify backup was created with correct naming
-            assert backup_path.name == ".roomodes_1"
-            assert backup_path.exists()
-            
-            # Create another backup to test numbering
-            roomodes_file.write_text("updated content")
-            backup_path2 = backup_manager.backup_local_roomodes()
-            assert backup_path2.name == ".roomodes_2"
-            
-            # List backups
-            all_backups = backup_manager.list_available_backups()
-            assert len(all_backups['local_roomodes']) == 2
+        project_dir = tmp_path
+        
+        # Create test files
+        roomodes_file = project_dir / ".roomodes"
+        roomodes_file.write_text("test content")
+        
+        # Use BackupManager directly to create backup
+        backup_manager = BackupManager(project_dir)
+        backup_path = backup_manager.backup_local_roomodes()
+        
+        # Verify backup was created with correct naming
+        assert backup_path.name == ".roomodes_1"
+        assert backup_path.exists()
+        
+        # Create another backup to test numbering
+        roomodes_file.write_text("updated content")
+        backup_path2 = backup_manager.backup_local_roomodes()
+        assert backup_path2.name == ".roomodes_2"
+        
+        # List backups
+        all_backups = backup_manager.list_available_backups()
+        assert len(all_backups['local_roomodes']) == 2
     
-    def test_backup_restore_preserves_content(self):
+    def test_backup_restore_preserves_content(self, tmp_path):
         """Test that backup and restore preserves file content exactly."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_dir = Path(temp_dir)
-            
-            # Create test file with specific content
-            original_content = "Original content\nWith multiple lines\nAnd special chars: àáâãäå"
-            roomodes_file = project_dir / ".roomodes"
-            roomodes_file.write_text(original_content, encoding='utf-8')
-            
-            # Create backup
-            backup_manager = BackupManager(project_dir)
-            backup_manager.backup_local_roomodes()
-            
-            # Modify original
-            roomodes_file.write_text("Modified content")
-            
-            # Restore
-            restored_path = backup_manager.restore_local_roomodes()
-            
-            # Verify content is exactly the same
-            restored_content = roomodes_file.read_text(encoding='utf-8')
-            assert restored_content == original_content
-            assert restored_path == roomodes_file
+        project_dir = tmp_path
+        
+        # Create test file with specific content
+        original_content = "Original content\nWith multiple lines\nAnd special chars: àáâãäå"
+        roomodes_file = project_dir / ".roomodes"
+        roomodes_file.write_text(original_content, encoding='utf-8')
+        
+        # Create backup
+        backup_manager = BackupManager(project_dir)
+        backup_manager.backup_local_roomodes()
+        
+        # Modify original
+        roomodes_file.write_text("Modified content")
+        
+        # Restore
+        restored_path = backup_manager.restore_local_roomodes()
+        
+        # Verify content is exactly the same
+        restored_content = roomodes_file.read_text(encoding='utf-8')
+        assert restored_content == original_content
+        assert restored_path == roomodes_file
 
 
 if __name__ == "__main__":
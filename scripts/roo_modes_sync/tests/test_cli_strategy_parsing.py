@@ -5,91 +5,193 @@ Tests for CLI strategy parsing functionality.
 Tests the parse_strategy_argument function and its integration with sync commands.
 """
 
+import logging
 import pytest
-import tempfile
-import sys
-import yaml
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, mock_open
 import argparse
 
-# Add the parent directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from roo_modes_sync.cli import parse_strategy_argument, sync_global, sync_local
+from roo_modes_sync.exceptions import SyncError
 
-# Import modules with fallback mechanism
-try:
-    from cli import parse_strategy_argument, sync_global, sync_local
-    from exceptions import SyncError
-except ImportError:
-    # Fallback: add core directory to path
-    core_dir = Path(__file__).parent.parent / "core"
-    sys.path.insert(0, str(core_dir))
-    sys.path.insert(0, str(Path(__file__).parent.parent))
-    from cli import parse_strategy_argument, sync_global, sync_local
-    from exceptions import SyncError
+
+# Config file contents shared by several tests, built once at import
+_GROUPINGS_TEST_YAML = """\
+strategy: groupings
+mode_groups:
+  test:
+  - mode1
+active_group: test
+"""
+
+_HYBRID_RESEARCH_YAML = """\
+strategy: groupings
+mode_groups:
+  research_phase:
+  - docs-amo-hybrid
+  - architect-kdap-hybrid
+  development_phase:
+  - code-kse-hybrid
+  - debug-sivs-hybrid
+  integration_phase:
+  - orchestrator-ccf-hybrid
+  - docs-amo-hybrid
+active_group: research_phase
+"""
+
+
+def _write_config(tmp_path_factory, filename, content):
+    """Write a configuration file into a fresh session temp directory."""
+    config_file = tmp_path_factory.mktemp("cfg") / filename
+    config_file.write_text(content)
+    return config_file
+
+
+@pytest.fixture(scope="session")
+def groupings_config_file(tmp_path_factory):
+    """Basic groupings configuration with an active group."""
+    return _write_config(tmp_path_factory, "groupings.yaml", """\
+strategy: groupings
+mode_groups:
+  development:
+  - code
+  - debug
+  planning:
+  - architect
+  - ask
+active_group: development
+""")
+
+
+@pytest.fixture(scope="session")
+def complex_config_file(tmp_path_factory):
+    """Groupings configuration with several options besides the strategy."""
+    return _write_config(tmp_path_factory, "complex.yaml", _HYBRID_RESEARCH_YAML + """\
+fallback_strategy: strategic
+group_priorities:
+- research_phase
+- development_phase
+- integration_phase
+""")
+
+
+@pytest.fixture(scope="session")
+def plain_options_config_file(tmp_path_factory):
+    """Configuration with a strategy and two plain options."""
+    return _write_config(tmp_path_factory, "test.yaml", """\
+strategy: groupings
+option1: value1
+option2: value2
+""")
+
+
+@pytest.fixture(scope="session")
+def invalid_yaml_config_file(tmp_path_factory):
+    """Malformed YAML configuration."""
+    return _write_config(tmp_path_factory, "invalid.yaml", "invalid: yaml: content: [")
+
+
+@pytest.fixture(scope="session")
+def list_config_file(tmp_path_factory):
+    """YAML configuration whose top level is a list."""
+    return _write_config(tmp_path_factory, "list.yaml", "- item1\n- item2")
+
+
+@pytest.fixture(scope="session")
+def no_strategy_config_file(tmp_path_factory):
+    """Configuration without a 'strategy' field."""
+    return _write_config(tmp_path_factory, "no_strategy.yaml", """\
+mode_groups:
+  test:
+  - mode1
+active_group: test
+""")
+
+
+@pytest.fixture(scope="session")
+def empty_strategy_config_file(tmp_path_factory):
+    """Configuration with a null 'strategy' field."""
+    return _write_config(tmp_path_factory, "empty_strategy.yaml", """\
+strategy: null
+other_option: value
+""")
+
+
+@pytest.fixture(scope="session")
+def config_dir_path(tmp_path_factory):
+    """Directory named like a configuration file."""
+    config_path = tmp_path_factory.mktemp("cfg") / "config.yaml"
+    config_path.mkdir()
+    return config_path
+
+
+@pytest.fixture(scope="session")
+def hybrid_research_config_file(tmp_path_factory):
+    """Recreation of examples/mode-groupings/hybrid-research-workflow.yaml."""
+    return _write_config(
+        tmp_path_factory, "hybrid-research-workflow.yaml", _HYBRID_RESEARCH_YAML
+    )
+
+
+@pytest.fixture(scope="session")
+def nested_examples_root(tmp_path_factory):
+    """Root directory containing examples/mode-groupings/test-config.yaml."""
+    root = tmp_path_factory.mktemp("nested")
+    examples_dir = root / "examples" / "mode-groupings"
+    examples_dir.mkdir(parents=True)
+    (examples_dir / "test-config.yaml").write_text(_GROUPINGS_TEST_YAML)
+    return root
+
+
+@pytest.fixture(scope="session")
+def override_config_file(tmp_path_factory):
+    """Configuration that sets an option also passed on the command line."""
+    return _write_config(tmp_path_factory, "config.yaml", """\
+strategy: groupings
+mode_groups:
+  test:
+  - mode1
+no_backup: false
+custom_option: value
+""")
 
 
 class TestParseStrategyArgument:
     """Test the parse_strategy_argument function."""
     
-    def test_parse_simple_strategy_name(self):
-        """Test parsing a simple strategy name."""
-        strategy_name, options = parse_strategy_argument("groupings")
-        
-        assert strategy_name == "groupings"
-        assert options == {}
-    
-    def test_parse_alphabetical_strategy_name(self):
-        """Test parsing alphabetical strategy name."""
-        strategy_name, options = parse_strategy_argument("alphabetical")
-        
-        assert strategy_name == "alphabetical"
-        assert options == {}
-    
-    def test_parse_strategic_strategy_name(self):
-        """Test parsing strategic strategy name."""
-        strategy_name, options = parse_strategy_argument("strategic")
-        
-        assert strategy_name == "strategic"
-        assert options == {}
+    @pytest.mark.parametrize("name", ["groupings", "alphabetical", "strategic"])
+    def test_parse_simple_strategy_name(self, name):
+        """Test parsing a plain strategy name."""
+        assert parse_strategy_argument(name) == (name, {})
 
 
 class TestParseStrategyFileDetection:
     """Test file path detection logic in parse_strategy_argument."""
     
-    def test_detects_unix_path(self):
+    def test_detects_unix_path(self, tmp_path):
         """Test detection of Unix-style paths."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "config.yaml"
-            config_content = {
-                'strategy': 'groupings',
-                'mode_groups': {'test': ['mode1']}
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            strategy_name, options = parse_strategy_argument(str(config_file))
-            
-            assert strategy_name == "groupings"
-            assert 'mode_groups' in options
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "strategy: groupings\n"
+            "mode_groups:\n"
+            "  test:\n"
+            "  - mode1\n"
+        )
+        
+        strategy_name, options = parse_strategy_argument(str(config_file))
+        
+        assert strategy_name == "groupings"
+        assert 'mode_groups' in options
     
     def test_detects_windows_path(self):
         """Test detection of Windows-style paths."""
-        # Import yaml at the top of the function
-        import yaml
-        from unittest.mock import patch, mock_open
-        
-        config_content = {
-            'strategy': 'groupings',
-            'active_group': 'test_group'
-        }
-        
         # Create a Windows-style path that actually exists
         # We'll use the actual path but test that backslashes are detected as file paths
         windows_style_arg = "config\\subdir\\file.yaml"
         
         # Test that the detection logic works (should detect as file path)
         # We'll mock the file existence and content loading
-        mock_content = yaml.dump(config_content)
+        mock_content = "strategy: groupings\nactive_group: test_group\n"
         with patch('builtins.open', mock_open(read_data=mock_content)):
             with patch('pathlib.Path.exists', return_value=True):
                 strategy_name, options = parse_strategy_argument(windows_style_arg)
@@ -97,119 +199,70 @@ class TestParseStrategyFileDetection:
         assert strategy_name == "groupings"
         assert options['active_group'] == 'test_group'
     
-    def test_detects_yaml_extension(self):
+    def test_detects_yaml_extension(self, tmp_path, monkeypatch):
         """Test detection of .yaml extension without path separators."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "config.yaml"
-            config_content = {
-                'strategy': 'strategic',
-                'priority_modes': ['important']
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            # Change to temp directory and use just filename
-            import os
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_dir)
-                strategy_name, options = parse_strategy_argument("config.yaml")
-                
-                assert strategy_name == "strategic"
-                assert options['priority_modes'] == ['important']
-            finally:
-                os.chdir(original_cwd)
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "strategy: strategic\n"
+            "priority_modes:\n"
+            "- important\n"
+        )
+        
+        # Change to temp directory and use just filename
+        monkeypatch.chdir(tmp_path)
+        strategy_name, options = parse_strategy_argument("config.yaml")
+        
+        assert strategy_name == "strategic"
+        assert options['priority_modes'] == ['important']
     
-    def test_detects_yml_extension(self):
+    def test_detects_yml_extension(self, tmp_path, monkeypatch):
         """Test detection of .yml extension."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "config.yml"
-            config_content = {
-                'strategy': 'alphabetical',
-                'reverse_order': True
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            import os
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_dir)
-                strategy_name, options = parse_strategy_argument("config.yml")
-                
-                assert strategy_name == "alphabetical"
-                assert options['reverse_order'] == True
-            finally:
-                os.chdir(original_cwd)
+        config_file = tmp_path / "config.yml"
+        config_file.write_text(
+            "strategy: alphabetical\n"
+            "reverse_order: true\n"
+        )
+        
+        monkeypatch.chdir(tmp_path)
+        strategy_name, options = parse_strategy_argument("config.yml")
+        
+        assert strategy_name == "alphabetical"
+        assert options['reverse_order'] == True
 
 
 class TestParseStrategyFileContent:
     """Test parsing of configuration file content."""
     
-    def test_parse_basic_groupings_config(self):
+    def test_parse_basic_groupings_config(self, groupings_config_file):
         """Test parsing a basic groupings configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "groupings.yaml"
-            config_content = {
-                'strategy': 'groupings',
-                'mode_groups': {
-                    'development': ['code', 'debug'],
-                    'planning': ['architect', 'ask']
-                },
-                'active_group': 'development'
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            strategy_name, options = parse_strategy_argument(str(config_file))
-            
-            assert strategy_name == "groupings"
-            assert 'mode_groups' in options
-            assert 'active_group' in options
-            assert options['active_group'] == 'development'
-            assert options['mode_groups']['development'] == ['code', 'debug']
-            assert options['mode_groups']['planning'] == ['architect', 'ask']
+        strategy_name, options = parse_strategy_argument(str(groupings_config_file))
+        
+        assert strategy_name == "groupings"
+        assert 'mode_groups' in options
+        assert 'active_group' in options
+        assert options['active_group'] == 'development'
+        assert options['mode_groups']['development'] == ['code', 'debug']
+        assert options['mode_groups']['planning'] == ['architect', 'ask']
     
-    def test_parse_complex_config_with_multiple_options(self):
+    def test_parse_complex_config_with_multiple_options(self, complex_config_file):
         """Test parsing complex configuration with multiple options."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "complex.yaml"
-            config_content = {
-                'strategy': 'groupings',
-                'mode_groups': {
-                    'research_phase': ['docs-amo-hybrid', 'architect-kdap-hybrid'],
-                    'development_phase': ['code-kse-hybrid', 'debug-sivs-hybrid'],
-                    'integration_phase': ['orchestrator-ccf-hybrid', 'docs-amo-hybrid']
-                },
-                'active_group': 'research_phase',
-                'fallback_strategy': 'strategic',
-                'group_priorities': ['research_phase', 'development_phase', 'integration_phase']
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            strategy_name, options = parse_strategy_argument(str(config_file))
-            
-            assert strategy_name == "groupings"
-            assert len(options) == 4  # All fields except 'strategy'
-            assert 'strategy' not in options  # Should be excluded
-            assert options['active_group'] == 'research_phase'
-            assert options['fallback_strategy'] == 'strategic'
-            assert 'group_priorities' in options
+        strategy_name, options = parse_strategy_argument(str(complex_config_file))
+        
+        assert strategy_name == "groupings"
+        assert len(options) == 4  # All fields except 'strategy'
+        assert 'strategy' not in options  # Should be excluded
+        assert options['active_group'] == 'research_phase'
+        assert options['fallback_strategy'] == 'strategic'
+        assert 'group_priorities' in options
     
-    def test_parse_config_excludes_strategy_field(self):
+    def test_parse_config_excludes_strategy_field(self, plain_options_config_file):
         """Test that the 'strategy' field is properly excluded from options."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "test.yaml"
-            config_content = {
-                'strategy': 'groupings',
-                'option1': 'value1',
-                'option2': 'value2'
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            strategy_name, options = parse_strategy_argument(str(config_file))
-            
-            assert strategy_name == "groupings"
-            assert 'strategy' not in options
-            assert options['option1'] == 'value1'
-            assert options['option2'] == 'value2'
+        strategy_name, options = parse_strategy_argument(str(plain_options_config_file))
+        
+        assert strategy_name == "groupings"
+        assert 'strategy' not in options
+        assert options['option1'] == 'value1'
+        assert options['option2'] == 'value2'
 
 
 class TestParseStrategyErrorHandling:
@@ -223,121 +276,77 @@ class TestParseStrategyErrorHandling:
         assert "Configuration file not found" in str(exc_info.value)
         assert "nonexistent/file.yaml" in str(exc_info.value)
     
-    def test_invalid_yaml_error(self):
+    def test_invalid_yaml_error(self, invalid_yaml_config_file):
         """Test error when YAML file is malformed."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "invalid.yaml"
-            config_file.write_text("invalid: yaml: content: [")
-            
-            with pytest.raises(SyncError) as exc_info:
-                parse_strategy_argument(str(config_file))
-            
-            assert "Error parsing configuration file" in str(exc_info.value)
+        with pytest.raises(SyncError) as exc_info:
+            parse_strategy_argument(str(invalid_yaml_config_file))
+        
+        assert "Error parsing configuration file" in str(exc_info.value)
     
-    def test_non_dict_yaml_error(self):
+    def test_non_dict_yaml_error(self, list_config_file):
         """Test error when YAML content is not a dictionary."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "list.yaml"
-            config_file.write_text("- item1\n- item2")
-            
-            with pytest.raises(SyncError) as exc_info:
-                parse_strategy_argument(str(config_file))
-            
-            assert "Invalid configuration file format" in str(exc_info.value)
+        with pytest.raises(SyncError) as exc_info:
+            parse_strategy_argument(str(list_config_file))
+        
+        assert "Invalid configuration file format" in str(exc_info.value)
     
-    def test_missing_strategy_field_error(self):
+    def test_missing_strategy_field_error(self, no_strategy_config_file):
         """Test error when 'strategy' field is missing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "no_strategy.yaml"
-            config_content = {
-                'mode_groups': {'test': ['mode1']},
-                'active_group': 'test'
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            with pytest.raises(SyncError) as exc_info:
-                parse_strategy_argument(str(config_file))
-            
-            assert "No 'strategy' field found" in str(exc_info.value)
+        with pytest.raises(SyncError) as exc_info:
+            parse_strategy_argument(str(no_strategy_config_file))
+        
+        assert "No 'strategy' field found" in str(exc_info.value)
     
-    def test_empty_strategy_field_error(self):
+    def test_empty_strategy_field_error(self, empty_strategy_config_file):
         """Test error when 'strategy' field is empty/None."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "empty_strategy.yaml"
-            config_content = {
-                'strategy': None,
-                'other_option': 'value'
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            with pytest.raises(SyncError) as exc_info:
-                parse_strategy_argument(str(config_file))
-            
-            assert "No 'strategy' field found" in str(exc_info.value)
+        with pytest.raises(SyncError) as exc_info:
+            parse_strategy_argument(str(empty_strategy_config_file))
+        
+        assert "No 'strategy' field found" in str(exc_info.value)
     
-    def test_general_file_access_error(self):
+    def test_general_file_access_error(self, config_dir_path):
         """Test handling of general file access errors."""
-        # Create a directory with the same name as the file we're trying to read
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = Path(temp_dir) / "config.yaml"
-            config_path.mkdir()  # Create directory instead of file
-            
-            with pytest.raises(SyncError) as exc_info:
-                parse_strategy_argument(str(config_path))
-            
-            assert "Error loading configuration file" in str(exc_info.value)
+        # config_dir_path is a directory with the name of the file we're trying to read
+        with pytest.raises(SyncError) as exc_info:
+            parse_strategy_argument(str(config_dir_path))
+        
+        assert "Error loading configuration file" in str(exc_info.value)
 
 
 class TestParseStrategyLogging:
     """Test logging behavior in parse_strategy_argument."""
     
-    def test_logs_successful_config_load(self, caplog):
+    def test_logs_successful_config_load(self, tmp_path, caplog):
         """Test that successful config load is logged."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "test.yaml"
-            config_content = {
-                'strategy': 'groupings',
-                'test_option': 'test_value'
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            with caplog.at_level('INFO'):
-                parse_strategy_argument(str(config_file))
-            
-            assert "Loaded strategy 'groupings'" in caplog.text
-            assert str(config_file) in caplog.text
+        config_file = tmp_path / "test.yaml"
+        config_file.write_text(
+            "strategy: groupings\n"
+            "test_option: test_value\n"
+        )
+        
+        caplog.set_level(logging.INFO, logger="roo_modes_cli")
+        parse_strategy_argument(str(config_file))
+        
+        assert "Loaded strategy 'groupings'" in caplog.text
+        assert str(config_file) in caplog.text
 
 
 class TestSyncCommandIntegration:
     """Test integration of parse_strategy_argument with sync commands."""
     
     @pytest.fixture
-    def temp_modes_dir(self):
-        """Create a temporary modes directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            modes_dir = Path(temp_dir) / "modes"
-            modes_dir.mkdir()
-            
-            # Create a test mode file
-            test_mode = modes_dir / "test.yaml"
-            test_mode.write_text("""
-slug: test
-name: Test Mode
-roleDefinition: A test mode
-groups:
-  - edit
-source: global
-""")
-            yield modes_dir
+    def mock_mode_sync(self):
+        """Patch cli.ModeSync with a mock whose sync succeeds."""
+        with patch('roo_modes_sync.cli.ModeSync') as mock_mode_sync:
+            mock_sync_instance = mock_mode_sync.return_value
+            mock_sync_instance.sync_modes.return_value = True
+            mock_sync_instance.global_config_path = Path("/test/global.roomodes")
+            mock_sync_instance.local_config_path = Path("/test/project/.roomodes")
+            yield mock_mode_sync
     
-    @patch('cli.ModeSync')
     def test_sync_global_with_strategy_name(self, mock_mode_sync, temp_modes_dir, capsys):
         """Test sync_global with a simple strategy name."""
-        # Setup mock
-        mock_sync_instance = MagicMock()
-        mock_sync_instance.sync_modes.return_value = True
-        mock_sync_instance.global_config_path = Path("/test/global.roomodes")
-        mock_mode_sync.return_value = mock_sync_instance
+        mock_sync_instance = mock_mode_sync.return_value
         
         # Create args
         args = argparse.Namespace(
@@ -359,99 +368,83 @@ source: global
         assert call_args[1]['options'] == {'no_backup': False}
         assert call_args[1]['dry_run'] == True
     
-    @patch('cli.ModeSync')
-    def test_sync_global_with_config_file(self, mock_mode_sync, temp_modes_dir, capsys):
+    def test_sync_global_with_config_file(self, tmp_path, mock_mode_sync, temp_modes_dir, capsys):
         """Test sync_global with a configuration file."""
-        # Setup mock
-        mock_sync_instance = MagicMock()
-        mock_sync_instance.sync_modes.return_value = True
-        mock_sync_instance.global_config_path = Path("/test/global.roomodes")
-        mock_mode_sync.return_value = mock_sync_instance
+        mock_sync_instance = mock_mode_sync.return_value
         
         # Create config file
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "config.yaml"
-            config_content = {
-                'strategy': 'groupings',
-                'mode_groups': {'test': ['mode1']},
-                'active_group': 'test'
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            # Create args
-            args = argparse.Namespace(
-                modes_dir=temp_modes_dir,
-                config=None,
-                strategy=str(config_file),
-                dry_run=False,
-                no_backup=True
-            )
-            
-            # Test
-            result = sync_global(args)
-            
-            # Verify
-            assert result == 0
-            mock_sync_instance.sync_modes.assert_called_once()
-            call_args = mock_sync_instance.sync_modes.call_args
-            assert call_args[1]['strategy_name'] == "groupings"
-            expected_options = {
-                'no_backup': True,
-                'mode_groups': {'test': ['mode1']},
-                'active_group': 'test'
-            }
-            assert call_args[1]['options'] == expected_options
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(_GROUPINGS_TEST_YAML)
+        
+        # Create args
+        args = argparse.Namespace(
+            modes_dir=temp_modes_dir,
+            config=None,
+            strategy=str(config_file),
+            dry_run=False,
+            no_backup=True
+        )
+        
+        # Test
+        result = sync_global(args)
+        
+        # Verify
+        assert result == 0
+        mock_sync_instance.sync_modes.assert_called_once()
+        call_args = mock_sync_instance.sync_modes.call_args
+        assert call_args[1]['strategy_name'] == "groupings"
+        expected_options = {
+            'no_backup': True,
+            'mode_groups': {'test': ['mode1']},
+            'active_group': 'test'
+        }
+        assert call_args[1]['options'] == expected_options
     
-    @patch('cli.ModeSync')
-    def test_sync_local_with_config_file(self, mock_mode_sync, temp_modes_dir, capsys):
+    def test_sync_local_with_config_file(self, tmp_path, mock_mode_sync, temp_modes_dir, capsys):
         """Test sync_local with a configuration file."""
-        # Setup mock
-        mock_sync_instance = MagicMock()
-        mock_sync_instance.sync_modes.return_value = True
-        mock_sync_instance.local_config_path = Path("/test/project/.roomodes")
-        mock_mode_sync.return_value = mock_sync_instance
+        mock_sync_instance = mock_mode_sync.return_value
         
         # Create config file
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "groupings.yaml"
-            config_content = {
-                'strategy': 'groupings',
-                'mode_groups': {
-                    'dev': ['code', 'debug'],
-                    'docs': ['ask', 'architect']
-                },
-                'active_group': 'dev'
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            # Create args
-            args = argparse.Namespace(
-                modes_dir=temp_modes_dir,
-                project_dir="/test/project",
-                strategy=str(config_file),
-                dry_run=False,
-                no_backup=False
-            )
-            
-            # Test
-            result = sync_local(args)
-            
-            # Verify
-            assert result == 0
-            mock_sync_instance.sync_modes.assert_called_once()
-            call_args = mock_sync_instance.sync_modes.call_args
-            assert call_args[1]['strategy_name'] == "groupings"
-            expected_options = {
-                'no_backup': False,
-                'mode_groups': {
-                    'dev': ['code', 'debug'],
-                    'docs': ['ask', 'architect']
-                },
-                'active_group': 'dev'
-            }
-            assert call_args[1]['options'] == expected_options
+        config_file = tmp_path / "groupings.yaml"
+        config_file.write_text(
+            "strategy: groupings\n"
+            "mode_groups:\n"
+            "  dev:\n"
+            "  - code\n"
+            "  - debug\n"
+            "  docs:\n"
+            "  - ask\n"
+            "  - architect\n"
+            "active_group: dev\n"
+        )
+        
+        # Create args
+        args = argparse.Namespace(
+            modes_dir=temp_modes_dir,
+            project_dir="/test/project",
+            strategy=str(config_file),
+            dry_run=False,
+            no_backup=False
+        )
+        
+        # Test
+        result = sync_local(args)
+        
+        # Verify
+        assert result == 0
+        mock_sync_instance.sync_modes.assert_called_once()
+        call_args = mock_sync_instance.sync_modes.call_args
+        assert call_args[1]['strategy_name'] == "groupings"
+        expected_options = {
+            'no_backup': False,
+            'mode_groups': {
+                'dev': ['code', 'debug'],
+                'docs': ['ask', 'architect']
+            },
+            'active_group': 'dev'
+        }
+        assert call_args[1]['options'] == expected_options
     
-    @patch('cli.ModeSync')
     def test_sync_command_handles_parse_error(self, mock_mode_sync, temp_modes_dir, capsys):
         """Test that sync commands handle parse errors gracefully."""
         # Create args with invalid config file
@@ -481,83 +474,41 @@ source: global
 class TestRealWorldScenarios:
     """Test real-world usage scenarios."""
     
-    def test_hybrid_research_workflow_config(self):
+    def test_hybrid_research_workflow_config(self, hybrid_research_config_file):
         """Test parsing the actual hybrid-research-workflow.yaml config."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "hybrid-research-workflow.yaml"
-            # Recreate the actual config content
-            config_content = {
-                'strategy': 'groupings',
-                'mode_groups': {
-                    'research_phase': ['docs-amo-hybrid', 'architect-kdap-hybrid'],
-                    'development_phase': ['code-kse-hybrid', 'debug-sivs-hybrid'],
-                    'integration_phase': ['orchestrator-ccf-hybrid', 'docs-amo-hybrid']
-                },
-                'active_group': 'research_phase'
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            strategy_name, options = parse_strategy_argument(str(config_file))
-            
-            assert strategy_name == "groupings"
-            assert options['active_group'] == 'research_phase'
-            assert len(options['mode_groups']) == 3
-            assert 'docs-amo-hybrid' in options['mode_groups']['research_phase']
-            assert 'architect-kdap-hybrid' in options['mode_groups']['research_phase']
+        strategy_name, options = parse_strategy_argument(str(hybrid_research_config_file))
+        
+        assert strategy_name == "groupings"
+        assert options['active_group'] == 'research_phase'
+        assert len(options['mode_groups']) == 3
+        assert 'docs-amo-hybrid' in options['mode_groups']['research_phase']
+        assert 'architect-kdap-hybrid' in options['mode_groups']['research_phase']
     
-    def test_relative_path_resolution(self):
+    def test_relative_path_resolution(self, nested_examples_root, monkeypatch):
         """Test that relative paths work correctly."""
-        # Create a nested directory structure
-        with tempfile.TemporaryDirectory() as temp_dir:
-            examples_dir = Path(temp_dir) / "examples" / "mode-groupings"
-            examples_dir.mkdir(parents=True)
-            
-            config_file = examples_dir / "test-config.yaml"
-            config_content = {
-                'strategy': 'groupings',
-                'mode_groups': {'test': ['mode1']},
-                'active_group': 'test'
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            # Change to temp directory and use relative path
-            import os
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(temp_dir)
-                relative_path = "examples/mode-groupings/test-config.yaml"
-                strategy_name, options = parse_strategy_argument(relative_path)
-                
-                assert strategy_name == "groupings"
-                assert options['active_group'] == 'test'
-            finally:
-                os.chdir(original_cwd)
+        # Change to the root directory and use relative path
+        monkeypatch.chdir(nested_examples_root)
+        relative_path = "examples/mode-groupings/test-config.yaml"
+        strategy_name, options = parse_strategy_argument(relative_path)
+        
+        assert strategy_name == "groupings"
+        assert options['active_group'] == 'test'
     
-    def test_options_override_priority(self):
+    def test_options_override_priority(self, override_config_file):
         """Test that command line options correctly merge with config file options."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_file = Path(temp_dir) / "config.yaml"
-            config_content = {
-                'strategy': 'groupings',
-                'mode_groups': {'test': ['mode1']},
-                'no_backup': False,  # This should be overridden by CLI args
-                'custom_option': 'value'
-            }
-            config_file.write_text(yaml.dump(config_content))
-            
-            strategy_name, options = parse_strategy_argument(str(config_file))
-            
-            # Simulate CLI argument merging as done in sync functions
-            # The actual implementation puts CLI options first, then updates with config
-            cli_options = {'no_backup': True}
-            merged_options = cli_options.copy()
-            merged_options.update(options)
-            
-            # Config options override CLI options in current implementation
-            # This matches the actual behavior in sync_global and sync_local
-            assert merged_options['no_backup'] == False  # Config overrides CLI
-            assert merged_options['custom_option'] == 'value'
-            assert merged_options['mode_groups'] == {'test': ['mode1']}
+        strategy_name, options = parse_strategy_argument(str(override_config_file))
+        
+        # Simulate CLI argument merging as done in sync functions
+        # The actual implementation puts CLI options first, then updates with config
+        cli_options = {'no_backup': True}
+        merged_options = cli_options.copy()
+        merged_options.update(options)
+        
+        # Config options override CLI options in current implementation
+        # This matches the actual behavior in sync_global and sync_local
+        assert merged_options['no_backup'] == False  # Config overrides CLI
+        assert merged_options['custom_option'] == 'value'
+        assert merged_options['mode_groups'] == {'test': ['mode1']}
 
 
 if __name__ == "__main__":
@@ -9,76 +9,41 @@ This file implements failing tests first (TDD Red phase) for:
 """
 
 import pytest
-import tempfile
-import sys
-import argparse
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import yaml
 
-# Add the parent directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from roo_modes_sync.core.discovery import ModeDiscovery
 
-try:
-    from cli import (
-        main, get_default_modes_dir, sync_global, sync_local, list_modes
-    )
-    from core.discovery import ModeDiscovery
-    from core.sync import ModeSync
-except ImportError:
-    # Fallback: mock for initial test setup
-    def main():
-        return 0
-    def get_default_modes_dir():
-        return Path("modes")
-    def sync_global(args):
-        return 0
-    def sync_local(args):
-        return 0
-    def list_modes(args):
-        return 0
-    
-    class ModeDiscovery:
-        def __init__(self, modes_dir, recursive=False):
-            self.modes_dir = modes_dir
-            self.recursive = recursive
-        
-        def discover_all_modes(self):
-            return {'core': [], 'enhanced': [], 'specialized': [], 'discovered': []}
-    
-    class ModeSync:
-        def __init__(self, modes_dir, recursive=False):
-            self.modes_dir = modes_dir
-            self.recursive = recursive
+cli = pytest.importorskip("roo_modes_sync.cli")
+from roo_modes_sync.cli import (  # noqa: E402
+    build_parser, main, get_default_modes_dir, sync_global, sync_local, list_modes
+)
 
 
-class TestCLIRecursiveSearchTDD:
-    """TDD tests for recursive search functionality."""
+@pytest.fixture(scope="session")
+def temp_project_structure(tmp_path_factory):
+    """Create a shared complex project structure for recursive search testing."""
+    project_dir = tmp_path_factory.mktemp("recursive_project")
     
-    @pytest.fixture
-    def temp_project_structure(self):
-        """Create a complex project structure for recursive search testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_dir = Path(temp_dir)
-            
-            # Root modes directory
-            modes_dir = project_dir / "modes"
-            modes_dir.mkdir()
-            
-            # Subdirectories with modes
-            hybrid_dir = modes_dir / "hybrid"
-            hybrid_dir.mkdir()
-            
-            specialized_dir = modes_dir / "specialized"
-            specialized_dir.mkdir()
-            
-            # Nested subdirectory
-            deep_dir = specialized_dir / "deep"
-            deep_dir.mkdir()
-            
-            # Create mode files at different levels
-            root_mode = modes_dir / "core.yaml"
-            root_mode.write_text("""
+    # Root modes directory
+    modes_dir = project_dir / "modes"
+    modes_dir.mkdir()
+    
+    # Subdirectories with modes
+    hybrid_dir = modes_dir / "hybrid"
+    hybrid_dir.mkdir()
+    
+    specialized_dir = modes_dir / "specialized"
+    specialized_dir.mkdir()
+    
+    # Nested subdirectory
+    deep_dir = specialized_dir / "deep"
+    deep_dir.mkdir()
+    
+    # Create mode files at different levels
+    root_mode = modes_dir / "core.yaml"
+    root_mode.write_text("""
 slug: core
 name: Core Mode
 roleDefinition: Core development mode
@@ -86,9 +51,9 @@ groups:
   - edit
 source: global
 """)
-            
-            hybrid_mode = hybrid_dir / "code-kse-hybrid.yaml"
-            hybrid_mode.write_text("""
+    
+    hybrid_mode = hybrid_dir / "code-kse-hybrid.yaml"
+    hybrid_mode.write_text("""
 slug: code-kse-hybrid
 name: Code+KSE Hybrid
 roleDefinition: Hybrid coding with knowledge synthesis
@@ -96,9 +61,9 @@ groups:
   - edit
 source: global
 """)
-            
-            specialized_mode = specialized_dir / "conport-maintenance.yaml"
-            specialized_mode.write_text("""
+    
+    specialized_mode = specialized_dir / "conport-maintenance.yaml"
+    specialized_mode.write_text("""
 slug: conport-maintenance
 name: ConPort Maintenance
 roleDefinition: ConPort database maintenance
@@ -106,9 +71,9 @@ groups:
   - conport
 source: global
 """)
-            
-            deep_mode = deep_dir / "deep-analysis.yaml"
-            deep_mode.write_text("""
+    
+    deep_mode = deep_dir / "deep-analysis.yaml"
+    deep_mode.write_text("""
 slug: deep-analysis
 name: Deep Analysis
 roleDefinition: Deep analytical mode
@@ -116,8 +81,79 @@ groups:
   - analysis
 source: global
 """)
-            
-            yield project_dir
+    
+    return project_dir
+
+
+@pytest.fixture(scope="session")
+def temp_modes_structure(tmp_path_factory):
+    """Create a shared temporary modes structure and sync-local target for sync testing."""
+    project_dir = tmp_path_factory.mktemp("sync_project")
+    modes_dir = project_dir / "modes"
+    modes_dir.mkdir()
+    
+    # Target directory for sync-local, next to the modes directory
+    (project_dir / "project").mkdir()
+    
+    # Create subdirectory with mode
+    hybrid_dir = modes_dir / "hybrid"
+    hybrid_dir.mkdir()
+    
+    # Create mode files
+    root_mode = modes_dir / "code.yaml"
+    root_mode.write_text("""
+slug: code
+name: Code Mode
+roleDefinition: Code development mode
+groups:
+  - edit
+source: global
+""")
+    
+    hybrid_mode = hybrid_dir / "code-hybrid.yaml"
+    hybrid_mode.write_text("""
+slug: code-hybrid
+name: Code Hybrid
+roleDefinition: Hybrid coding mode
+groups:
+  - edit
+source: global
+""")
+    
+    return project_dir
+
+
+@pytest.fixture(scope="session")
+def nested_modes_structure(tmp_path_factory):
+    """Create a shared nested directory structure for discovery testing."""
+    modes_dir = tmp_path_factory.mktemp("nested_root") / "modes"
+    modes_dir.mkdir()
+    
+    # Create nested structure: modes/category/subcategory/
+    core_dir = modes_dir / "core"
+    core_dir.mkdir()
+    
+    hybrid_dir = modes_dir / "hybrid"
+    hybrid_dir.mkdir()
+    
+    specialized_dir = modes_dir / "specialized"
+    specialized_dir.mkdir()
+    
+    deep_specialized = specialized_dir / "deep"
+    deep_specialized.mkdir()
+    
+    # Create modes at different levels
+    (modes_dir / "ask.yaml").write_text("slug: ask\nname: Ask\nroleDefinition: Q&A\ngroups: [ask]\n")
+    (core_dir / "code.yaml").write_text("slug: code\nname: Code\nroleDefinition: Coding\ngroups: [edit]\n")
+    (hybrid_dir / "code-kse.yaml").write_text("slug: code-kse\nname: Code KSE\nroleDefinition: KSE\ngroups: [edit]\n")
+    (specialized_dir / "conport.yaml").write_text("slug: conport\nname: ConPort\nroleDefinition: ConPort\ngroups: [conport]\n")
+    (deep_specialized / "analyzer.yaml").write_text("slug: analyzer\nname: Analyzer\nroleDefinition: Analysis\ngroups: [analysis]\n")
+    
+    return modes_dir
+
+
+class TestCLIRecursiveSearchTDD:
+    """TDD tests for recursive search functionality."""
     
     def test_recursive_search_default_behavior_fails_initially(self, temp_project_structure):
         """
@@ -175,57 +211,46 @@ source: global
         
         assert found_modes == expected_modes, f"Expected {expected_modes}, got {found_modes}"
     
-    def test_no_recurse_flag_functionality_fails_initially(self, temp_project_structure, monkeypatch):
+    def test_no_recurse_flag_functionality_fails_initially(self, temp_project_structure):
         """
         TDD Red: Test that --no-recurse flag disables recursive search.
         This test should FAIL initially.
         """
         modes_dir = temp_project_structure / "modes"
         
-        # Test CLI with --no-recurse flag
-        test_args = ["cli.py", "list", "--modes-dir", str(modes_dir), "--no-recurse"]
-        monkeypatch.setattr(sys, "argv", test_args)
-        
         # This should FAIL - --no-recurse option doesn't exist yet
-        with patch('cli.list_modes') as mock_list:
-            try:
-                result = main()
-                # Check that mock was called with non-recursive discovery
-                mock_list.assert_called_once()
-                args = mock_list.call_args[0][0]
-                assert hasattr(args, 'no_recurse'), "CLI should have no_recurse option"
-                assert args.no_recurse == True, "no_recurse should be True when flag is set"
-            except SystemExit:
-                # Expected failure - --no-recurse option doesn't exist yet
-                pytest.fail("CLI should accept --no-recurse option")
+        try:
+            args = build_parser().parse_args(["list", "--modes-dir", str(modes_dir), "--no-recurse"])
+        except SystemExit:
+            # Expected failure - --no-recurse option doesn't exist yet
+            pytest.fail("CLI should accept --no-recurse option")
+        
+        assert args.func is list_modes
+        assert hasattr(args, 'no_recurse'), "CLI should have no_recurse option"
+        assert args.no_recurse is True, "no_recurse should be True when flag is set"
 
 
 class TestCLIOptionalModesDirTDD:
     """TDD tests for optional --modes-dir functionality."""
     
-    def test_modes_dir_optional_with_default_fails_initially(self, monkeypatch):
+    def test_modes_dir_optional_with_default_fails_initially(self):
         """
         TDD Red: Test that --modes-dir is optional with default "modes".
         This test should FAIL initially if the current implementation requires --modes-dir.
         """
-        # Test CLI without --modes-dir argument
-        test_args = ["cli.py", "list"]
-        monkeypatch.setattr(sys, "argv", test_args)
-        
         # Mock get_default_modes_dir to return a known path
         default_modes_dir = Path.cwd() / "modes"
         
-        with patch('cli.get_default_modes_dir', return_value=default_modes_dir) as mock_default:
-            with patch('cli.list_modes') as mock_list:
-                try:
-                    result = main()
-                    # Should succeed without requiring --modes-dir
-                    mock_list.assert_called_once()
-                    args = mock_list.call_args[0][0]
-                    assert args.modes_dir == default_modes_dir, f"Expected {default_modes_dir}, got {args.modes_dir}"
-                except SystemExit as e:
-                    # If this fails, it means --modes-dir is still required
-                    pytest.fail(f"CLI should work without --modes-dir argument: {e}")
+        # The default is read when the parser is built, so build it under the patch
+        with patch('roo_modes_sync.cli.get_default_modes_dir', return_value=default_modes_dir):
+            try:
+                # Should succeed without requiring --modes-dir
+                args = build_parser().parse_args(["list"])
+            except SystemExit as e:
+                # If this fails, it means --modes-dir is still required
+                pytest.fail(f"CLI should work without --modes-dir argument: {e}")
+        
+        assert args.modes_dir == default_modes_dir, f"Expected {default_modes_dir}, got {args.modes_dir}"
     
     def test_default_modes_dir_resolution_fails_initially(self):
         """
@@ -239,76 +264,36 @@ class TestCLIOptionalModesDirTDD:
         assert default_dir.name == "modes" or str(default_dir).endswith("/modes"), \
             f"Default modes dir should end with 'modes', got {default_dir}"
     
-    def test_modes_dir_argument_parsing_backward_compatibility_fails_initially(self, monkeypatch):
+    def test_modes_dir_argument_parsing_backward_compatibility_fails_initially(self):
         """
         TDD Red: Test that --modes-dir still works when explicitly provided.
         This test ensures backward compatibility.
         """
         custom_modes_dir = Path("/custom/modes/path")
-        test_args = ["cli.py", "list", "--modes-dir", str(custom_modes_dir)]
-        monkeypatch.setattr(sys, "argv", test_args)
         
-        with patch('cli.list_modes') as mock_list:
-            try:
-                result = main()
-                mock_list.assert_called_once()
-                args = mock_list.call_args[0][0]
-                assert args.modes_dir == custom_modes_dir, \
-                    f"Expected {custom_modes_dir}, got {args.modes_dir}"
-            except SystemExit as e:
-                pytest.fail(f"CLI should accept explicit --modes-dir: {e}")
+        try:
+            args = build_parser().parse_args(["list", "--modes-dir", str(custom_modes_dir)])
+        except SystemExit as e:
+            pytest.fail(f"CLI should accept explicit --modes-dir: {e}")
+        
+        assert args.modes_dir == custom_modes_dir, \
+            f"Expected {custom_modes_dir}, got {args.modes_dir}"
 
 
 class TestCLISyncIntegrationTDD:
     """TDD tests for sync command integration with new features."""
     
-    @pytest.fixture
-    def temp_modes_structure(self):
-        """Create a temporary modes structure for sync testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_dir = Path(temp_dir)
-            modes_dir = project_dir / "modes"
-            modes_dir.mkdir()
-            
-            # Create subdirectory with mode
-            hybrid_dir = modes_dir / "hybrid"
-            hybrid_dir.mkdir()
-            
-            # Create mode files
-            root_mode = modes_dir / "code.yaml"
-            root_mode.write_text("""
-slug: code
-name: Code Mode
-roleDefinition: Code development mode
-groups:
-  - edit
-source: global
-""")
-            
-            hybrid_mode = hybrid_dir / "code-hybrid.yaml"
-            hybrid_mode.write_text("""
-slug: code-hybrid
-name: Code Hybrid
-roleDefinition: Hybrid coding mode
-groups:
-  - edit
-source: global
-""")
-            
-            yield project_dir
-    
-    def test_sync_global_uses_recursive_by_default_fails_initially(self, temp_modes_structure, monkeypatch):
+    def test_sync_global_uses_recursive_by_default_fails_initially(self, temp_modes_structure):
         """
         TDD Red: Test that sync-global uses recursive search by default.
         This test should FAIL initially.
         """
         modes_dir = temp_modes_structure / "modes"
         
-        test_args = ["cli.py", "sync-global", "--modes-dir", str(modes_dir), "--dry-run"]
-        monkeypatch.setattr(sys, "argv", test_args)
+        test_args = ["sync-global", "--modes-dir", str(modes_dir), "--dry-run"]
         
         # Mock ModeSync to capture how it's instantiated, but let sync_global run
-        with patch('cli.ModeSync') as mock_mode_sync:
+        with patch('roo_modes_sync.cli.ModeSync') as mock_mode_sync:
             # Mock ModeSync to capture recursive parameter
             mock_instance = MagicMock()
             mock_instance.sync_modes.return_value = True
@@ -316,7 +301,7 @@ source: global
             mock_mode_sync.return_value = mock_instance
             
             try:
-                result = main()
+                result = main(test_args)
                 # Check that ModeSync was created with recursive=True by default
                 mock_mode_sync.assert_called_once()
                 call_args = mock_mode_sync.call_args
@@ -328,91 +313,57 @@ source: global
             except Exception as e:
                 pytest.fail(f"sync-global should use recursive search by default: {e}")
     
-    def test_sync_global_with_no_recurse_flag_fails_initially(self, temp_modes_structure, monkeypatch):
+    def test_sync_global_with_no_recurse_flag_fails_initially(self, temp_modes_structure):
         """
         TDD Red: Test that sync-global respects --no-recurse flag.
         This test should FAIL initially.
         """
         modes_dir = temp_modes_structure / "modes"
         
-        test_args = ["cli.py", "sync-global", "--modes-dir", str(modes_dir), "--no-recurse", "--dry-run"]
-        monkeypatch.setattr(sys, "argv", test_args)
+        try:
+            args = build_parser().parse_args(
+                ["sync-global", "--modes-dir", str(modes_dir), "--no-recurse", "--dry-run"]
+            )
+        except SystemExit:
+            pytest.fail("CLI should accept --no-recurse option for sync-global")
         
-        with patch('cli.sync_global') as mock_sync:
-            try:
-                result = main()
-                mock_sync.assert_called_once()
-                args = mock_sync.call_args[0][0]
-                
-                # This should FAIL - --no-recurse option doesn't exist yet
-                assert hasattr(args, 'no_recurse'), "CLI should accept --no-recurse option"
-                assert args.no_recurse == True, "no_recurse should be True when flag is set"
-                
-            except SystemExit:
-                pytest.fail("CLI should accept --no-recurse option for sync-global")
+        # This should FAIL - --no-recurse option doesn't exist yet
+        assert args.func is sync_global
+        assert hasattr(args, 'no_recurse'), "CLI should accept --no-recurse option"
+        assert args.no_recurse is True, "no_recurse should be True when flag is set"
     
-    def test_sync_local_uses_recursive_by_default_fails_initially(self, temp_modes_structure, monkeypatch):
+    def test_sync_local_uses_recursive_by_default_fails_initially(self, temp_modes_structure):
         """
         TDD Red: Test that sync-local uses recursive search by default.
         This test should FAIL initially.
         """
         modes_dir = temp_modes_structure / "modes"
+        project_dir = temp_modes_structure / "project"
         
-        with tempfile.TemporaryDirectory() as temp_project:
-            test_args = ["cli.py", "sync-local", temp_project, "--modes-dir", str(modes_dir), "--dry-run"]
-            monkeypatch.setattr(sys, "argv", test_args)
+        test_args = ["sync-local", str(project_dir), "--modes-dir", str(modes_dir), "--dry-run"]
+        
+        # Mock ModeSync to capture how it's instantiated, but let sync_local run
+        with patch('roo_modes_sync.cli.ModeSync') as mock_mode_sync:
+            mock_instance = MagicMock()
+            mock_instance.sync_modes.return_value = True
+            mock_instance.local_config_path = Path("/test/path")
+            mock_mode_sync.return_value = mock_instance
             
-            # Mock ModeSync to capture how it's instantiated, but let sync_local run
-            with patch('cli.ModeSync') as mock_mode_sync:
-                mock_instance = MagicMock()
-                mock_instance.sync_modes.return_value = True
-                mock_instance.local_config_path = Path("/test/path")
-                mock_mode_sync.return_value = mock_instance
+            try:
+                result = main(test_args)
+                # This should FAIL - recursive parameter doesn't exist yet
+                mock_mode_sync.assert_called_once()
+                call_args = mock_mode_sync.call_args
+                assert 'recursive' in call_args.kwargs, "ModeSync should be called with recursive parameter"
+                assert call_args.kwargs['recursive'] == True, "recursive should be True by default"
                 
-                try:
-                    result = main()
-                    # This should FAIL - recursive parameter doesn't exist yet
-                    mock_mode_sync.assert_called_once()
-                    call_args = mock_mode_sync.call_args
-                    assert 'recursive' in call_args.kwargs, "ModeSync should be called with recursive parameter"
-                    assert call_args.kwargs['recursive'] == True, "recursive should be True by default"
-                    
-                except Exception as e:
-                    pytest.fail(f"sync-local should use recursive search by default: {e}")
+            except Exception as e:
+                pytest.fail(f"sync-local should use recursive search by default: {e}")
 
 
 class TestModeDiscoveryRecursiveTDD:
     """TDD tests for ModeDiscovery recursive functionality."""
     
-    @pytest.fixture
-    def nested_modes_structure(self):
-        """Create nested directory structure for discovery testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            modes_dir = Path(temp_dir) / "modes"
-            modes_dir.mkdir()
-            
-            # Create nested structure: modes/category/subcategory/
-            core_dir = modes_dir / "core"
-            core_dir.mkdir()
-            
-            hybrid_dir = modes_dir / "hybrid"
-            hybrid_dir.mkdir()
-            
-            specialized_dir = modes_dir / "specialized"
-            specialized_dir.mkdir()
-            
-            deep_specialized = specialized_dir / "deep"
-            deep_specialized.mkdir()
-            
-            # Create modes at different levels
-            (modes_dir / "ask.yaml").write_text("slug: ask\nname: Ask\nroleDefinition: Q&A\ngroups: [ask]\n")
-            (core_dir / "code.yaml").write_text("slug: code\nname: Code\nroleDefinition: Coding\ngroups: [edit]\n")
-            (hybrid_dir / "code-kse.yaml").write_text("slug: code-kse\nname: Code KSE\nroleDefinition: KSE\ngroups: [edit]\n")
-            (specialized_dir / "conport.yaml").write_text("slug: conport\nname: ConPort\nroleDefinition: ConPort\ngroups: [conport]\n")
-            (deep_specialized / "analyzer.yaml").write_text("slug: analyzer\nname: Analyzer\nroleDefinition: Analysis\ngroups: [analysis]\n")
-            
-            yield modes_dir
-    
     def test_mode_discovery_recursive_parameter_fails_initially(self, nested_modes_structure):
         """
         TDD Red: Test ModeDiscovery constructor accepts recursive parameter.
@@ -436,7 +387,7 @@ class TestModeDiscoveryRecursiveTDD:
         # This will fail because the method doesn't exist yet
         assert hasattr(discovery, '_get_yaml_files'), "ModeDiscovery should have _get_yaml_files method"
         
-        yaml_files = discovery._get_yaml_files()
+        yaml_files = list(discovery._get_yaml_files())
         
         # Should find all 5 YAML files
         assert len(yaml_files) == 5, f"Expected 5 YAML files with recursive search, got {len(yaml_files)}"
@@ -1,7 +1,7 @@
 """Test cases for mode discovery functionality."""
 
+import json
 import os
-import yaml
 import pytest
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -9,6 +9,17 @@ from typing import Dict, List, Any, Optional
 from roo_modes_sync.core.discovery import ModeDiscovery
 
 
+def _yaml_for(config: Dict[str, Any]) -> str:
+    """Render a flat mode config as YAML; JSON-encoded values are valid YAML flow nodes."""
+    return "".join(f"{key}: {json.dumps(value)}\n" for key, value in config.items())
+
+
+@pytest.fixture(scope="module")
+def categorizer():
+    """Share one ModeDiscovery for tests that only use its pure methods."""
+    return ModeDiscovery(Path("/tmp"))
+
+
 class TestModeDiscovery:
     """Test cases for ModeDiscovery class."""
     
@@ -22,8 +33,7 @@ class TestModeDiscovery:
     def create_mode_file(self, modes_dir: Path, slug: str, config: Dict[str, Any]) -> Path:
         """Helper to create a mode file in the test directory."""
         mode_file = modes_dir / f"{slug}.yaml"
-        with open(mode_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+        mode_file.write_text(_yaml_for(config), encoding='utf-8')
         return mode_file
         
     def create_valid_mode_config(self, slug: str, expected_category: str = None) -> Dict[str, Any]:
@@ -82,29 +92,27 @@ class TestModeDiscovery:
         # Verify mode count
         assert discovery.get_mode_count() == 5
     
-    def test_categorize_mode(self):
+    def test_categorize_mode(self, categorizer):
         """Test that mode slugs are correctly categorized."""
-        discovery = ModeDiscovery(Path("/tmp"))
-        
         # Test core category
-        assert discovery.categorize_mode("code") == "core"
-        assert discovery.categorize_mode("architect") == "core"
-        assert discovery.categorize_mode("debug") == "core"
-        assert discovery.categorize_mode("ask") == "core"
+        assert categorizer.categorize_mode("code") == "core"
+        assert categorizer.categorize_mode("architect") == "core"
+        assert categorizer.categorize_mode("debug") == "core"
+        assert categorizer.categorize_mode("ask") == "core"
         
         # Test enhanced category
-        assert discovery.categorize_mode("code-enhanced") == "enhanced"
-        assert discovery.categorize_mode("debug-plus") == "enhanced"
+        assert categorizer.categorize_mode("code-enhanced") == "enhanced"
+        assert categorizer.categorize_mode("debug-plus") == "enhanced"
         
         # Test specialized category
-        assert discovery.categorize_mode("code-maintenance") == "specialized"
-        assert discovery.categorize_mode("prompt-enhancer") == "specialized"
-        assert discovery.categorize_mode("diagram-creator") == "specialized"
-        assert discovery.categorize_mode("security-auditor") == "specialized"
+        assert categorizer.categorize_mode("code-maintenance") == "specialized"
+        assert categorizer.categorize_mode("prompt-enhancer") == "specialized"
+        assert categorizer.categorize_mode("diagram-creator") == "specialized"
+        assert categorizer.categorize_mode("security-auditor") == "specialized"
         
         # Test discovered category (fallback)
-        assert discovery.categorize_mode("custom") == "discovered"
-        assert discovery.categorize_mode("test") == "discovered"
+        assert categorizer.categorize_mode("custom") == "discovered"
+        assert categorizer.categorize_mode("test") == "discovered"
     
     def test_nonexistent_directory(self, tmp_path):
         """Test that discovery handles non-existent directories gracefully."""
@@ -131,22 +139,20 @@ class TestModeDiscovery:
         """Test validation of mode files."""
         # Create a valid mode file
         valid_file = temp_modes_dir / "valid.yaml"
-        with open(valid_file, 'w', encoding='utf-8') as f:
-            yaml.dump({
-                'slug': 'valid',
-                'name': 'Valid Mode',
-                'roleDefinition': 'This is a valid mode',
-                'groups': ['test']
-            }, f)
+        valid_file.write_text(_yaml_for({
+            'slug': 'valid',
+            'name': 'Valid Mode',
+            'roleDefinition': 'This is a valid mode',
+            'groups': ['test']
+        }), encoding='utf-8')
         
         # Create an invalid mode file (missing required fields)
         invalid_file = temp_modes_dir / "invalid.yaml"
-        with open(invalid_file, 'w', encoding='utf-8') as f:
-            yaml.dump({
-                'slug': 'invalid',
-                'name': 'Invalid Mode'
-                # Missing roleDefinition and groups
-            }, f)
+        invalid_file.write_text(_yaml_for({
+            'slug': 'invalid',
+            'name': 'Invalid Mode'
+            # Missing roleDefinition and groups
+        }), encoding='utf-8')
         
         # Create a corrupt YAML file
         corrupt_file = temp_modes_dir / "corrupt.yaml"
@@ -164,12 +170,10 @@ class TestModeDiscovery:
         # Test with non-existent file
         assert discovery._is_valid_mode_file(temp_modes_dir / "nonexistent.yaml") is False
     
-    def test_get_category_info(self):
+    def test_get_category_info(self, categorizer):
         """Test that category information is provided correctly."""
-        discovery = ModeDiscovery(Path("/tmp"))
-        
         # Get category info
-        categories = discovery.get_category_info()
+        categories = categorizer.get_category_info()
         
         # Verify categories are present
         assert "core" in categories
@@ -231,4 +235,159 @@ class TestModeDiscovery:
         assert info["category"] == "discovered"  # Based on categorization rules
         
         # Test invalid mode
-        assert discovery.get_mode_info("nonexistent-mode") is None
\ No newline at end of file
+        assert discovery.get_mode_info("nonexistent-mode") is None
+    
+    def test_parallel_discovery_matches_serial(self, temp_modes_dir, monkeypatch):
+        """Test that the thread pool path gives the same result as serial validation."""
+        from roo_modes_sync.core import discovery as discovery_module
+        
+        slugs = ["code", "debug", "code-enhanced", "docs-plus", "prompt-enhancer",
+                 "security-auditor", "custom-one", "custom-two"]
+        for index, slug in enumerate(slugs):
+            subdir = temp_modes_dir / f"group{index % 3}"
+            subdir.mkdir(exist_ok=True)
+            self.create_mode_file(subdir, slug, self.create_valid_mode_config(slug))
+        
+        # Invalid files: bad YAML, missing groups, empty groups
+        (temp_modes_dir / "group0" / "broken.yaml").write_text("invalid: yaml: content", encoding='utf-8')
+        no_groups = self.create_valid_mode_config("no-groups")
+        del no_groups["groups"]
+        self.create_mode_file(temp_modes_dir / "group1", "no-groups", no_groups)
+        empty_groups = self.create_valid_mode_config("empty-groups")
+        empty_groups["groups"] = []
+        self.create_mode_file(temp_modes_dir / "group2", "empty-groups", empty_groups)
+        
+        assert len(list(temp_modes_dir.rglob("*.yaml"))) >= discovery_module.PARALLEL_VALIDATION_MIN_FILES
+        parallel_modes = ModeDiscovery(temp_modes_dir).discover_all_modes()
+        
+        monkeypatch.setattr(discovery_module, "PARALLEL_VALIDATION_MIN_FILES", 1000)
+        serial_modes = ModeDiscovery(temp_modes_dir).discover_all_modes()
+        
+        assert parallel_modes == serial_modes
+        assert parallel_modes == {
+            'core': ["code", "debug"],
+            'enhanced': ["code-enhanced", "docs-plus"],
+            'specialized': ["prompt-enhancer", "security-auditor"],
+            'discovered': ["custom-one", "custom-two"]
+        }
+    
+    def test_get_mode_count_tracks_new_files(self, temp_modes_dir):
+        """Test that the mode count reflects files added after an earlier discovery."""
+        self.create_mode_file(temp_modes_dir, "code", self.create_valid_mode_config("code"))
+        
+        discovery = ModeDiscovery(temp_modes_dir)
+        assert discovery.get_mode_count() == 1
+        
+        self.create_mode_file(temp_modes_dir, "custom", self.create_valid_mode_config("custom"))
+        assert discovery.get_mode_count() == 2
+    
+    def test_rediscovery_sees_same_size_edit(self, temp_modes_dir):
+        """Test that an edit keeping the file size and mtime is picked up on re-discovery."""
+        mode_file = self.create_mode_file(temp_modes_dir, "custom", self.create_valid_mode_config("custom"))
+        discovery = ModeDiscovery(temp_modes_dir)
+        assert discovery.discover_all_modes()["discovered"] == ["custom"]
+        
+        # Break the file without changing its size, then restore the old mtime
+        original_stat = mode_file.stat()
+        original = mode_file.read_text(encoding='utf-8')
+        mode_file.write_text(original.replace("groups:", "groupz:"), encoding='utf-8')
+        os.utime(mode_file, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+        assert mode_file.stat().st_size == original_stat.st_size
+        
+        assert discovery.discover_all_modes()["discovered"] == []
+        
+        mode_file.write_text(original, encoding='utf-8')
+        assert discovery.discover_all_modes()["discovered"] == ["custom"]
+    
+    def test_invalid_file_fixed_after_discovery(self, temp_modes_dir):
+        """Test that a file that failed to parse is loaded once it is fixed."""
+        mode_file = temp_modes_dir / "custom.yaml"
+        mode_file.write_text("slug: custom\nname: [unclosed\nroleDefinition: x\ngroups: x\n", encoding='utf-8')
+        discovery = ModeDiscovery(temp_modes_dir)
+        assert discovery.discover_all_modes()["discovered"] == []
+        
+        self.create_mode_file(temp_modes_dir, "custom", self.create_valid_mode_config("custom"))
+        assert discovery.discover_all_modes()["discovered"] == ["custom"]
+    
+    def test_get_mode_info_returns_independent_copies(self, temp_modes_dir):
+        """Test that mutating returned mode info does not leak into later lookups."""
+        self.create_mode_file(temp_modes_dir, "custom", self.create_valid_mode_config("custom"))
+        discovery = ModeDiscovery(temp_modes_dir)
+        
+        info = discovery.get_mode_info("custom")
+        info["groups"].append("command")
+        
+        assert discovery.get_mode_info("custom")["groups"] == ["read", "edit"]
+    
+    def test_find_mode_by_name_prefers_exact_match(self, temp_modes_dir):
+        """Test that an exact name match wins over an earlier partial match."""
+        for slug, name in (("a-debug-plus", "Debug Plus"), ("z-debug", "Debug")):
+            config = self.create_valid_mode_config(slug)
+            config["name"] = name
+            self.create_mode_file(temp_modes_dir, slug, config)
+        
+        discovery = ModeDiscovery(temp_modes_dir)
+        
+        assert discovery.find_mode_by_name("debug") == "z-debug"
+        assert discovery.find_mode_by_name("DEBUG PLUS") == "a-debug-plus"
+        assert discovery.find_mode_by_name("PLUS") == "a-debug-plus"
+    
+    def test_find_mode_by_name_sees_edits(self, temp_modes_dir):
+        """Test that the name lookup follows renames made after an earlier lookup."""
+        config = self.create_valid_mode_config("custom")
+        config["name"] = "Old Name"
+        self.create_mode_file(temp_modes_dir, "custom", config)
+        
+        discovery = ModeDiscovery(temp_modes_dir)
+        assert discovery.find_mode_by_name("Old Name") == "custom"
+        
+        config["name"] = "Brand New Name"
+        self.create_mode_file(temp_modes_dir, "custom", config)
+        
+        assert discovery.find_mode_by_name("Old Name") is None
+        assert discovery.find_mode_by_name("brand new name") == "custom"
+    
+    def test_find_mode_by_name_in_subdirectory(self, temp_modes_dir):
+        """Test that modes in subdirectories are found unless recursion is disabled."""
+        subdir = temp_modes_dir / "nested" / "deeper"
+        subdir.mkdir(parents=True)
+        config = self.create_valid_mode_config("nested-mode")
+        config["name"] = "Nested Mode"
+        self.create_mode_file(subdir, "nested-mode", config)
+        
+        assert ModeDiscovery(temp_modes_dir).find_mode_by_name("nested mode") == "nested-mode"
+        assert ModeDiscovery(temp_modes_dir, recursive=False).find_mode_by_name("nested mode") is None
+    
+    def test_find_mode_by_name_sees_same_size_edit(self, temp_modes_dir):
+        """Test that a rename keeping the file size and mtime is seen by the name lookup."""
+        config = self.create_valid_mode_config("custom")
+        config["name"] = "Alpha Mode"
+        mode_file = self.create_mode_file(temp_modes_dir, "custom", config)
+        
+        discovery = ModeDiscovery(temp_modes_dir)
+        assert discovery.find_mode_by_name("alpha mode") == "custom"
+        
+        original_stat = mode_file.stat()
+        config["name"] = "Omega Mode"
+        self.create_mode_file(temp_modes_dir, "custom", config)
+        os.utime(mode_file, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+        assert mode_file.stat().st_size == original_stat.st_size
+        
+        assert discovery.find_mode_by_name("alpha mode") is None
+        assert discovery.find_mode_by_name("omega mode") == "custom"
+    
+    def test_category_patterns_reassignment_recompiles(self, temp_modes_dir):
+        """Test that assigning new category patterns changes categorization."""
+        discovery = ModeDiscovery(temp_modes_dir)
+        assert discovery.categorize_mode("custom-tool") == "discovered"
+        
+        patterns = dict(discovery.category_patterns)
+        patterns['specialized'] = patterns['specialized'] + (r'.*-tool$',)
+        discovery.category_patterns = patterns
+        
+        assert discovery.categorize_mode("custom-tool") == "specialized"
+        assert discovery.categorize_mode("code") == "core"
+        
+        # In-place edits would silently bypass the compiled pattern, so they are rejected
+        with pytest.raises(TypeError):
+            discovery.category_patterns['core'] = (r'^custom-tool$',)
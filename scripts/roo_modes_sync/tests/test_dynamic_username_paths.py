@@ -7,18 +7,20 @@ to ensure the CLI works correctly across different user environments.
 """
 
 import pytest
-import tempfile
 import os
-import sys
+import re
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import getpass
 
-# Add the parent directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Directory anchors resolved once at import
+_TEST_DIR = Path(__file__).resolve().parent
+_PKG_DIR = _TEST_DIR.parent
+_PROJECT_ROOT = _PKG_DIR.parent
+_REPO_ROOT = _PROJECT_ROOT.parent
 
 try:
-    from cli import get_default_modes_dir, main
+    from roo_modes_sync.cli import get_default_modes_dir, main
 except ImportError:
     # Fallback for initial test setup
     def get_default_modes_dir():
@@ -27,28 +29,113 @@ except ImportError:
         return 0
 
 
+# Hardcoded home-directory prefixes that must not appear in shipped files
+HARDCODED_PATTERNS = (
+    "/home/user/",
+    "/home/admin/",
+    "/home/developer/",
+    "/Users/user/",
+    "C:\\Users\\user\\",
+    "C:\\Users\\admin\\"
+)
+
+# Dynamic path resolution markers expected in Python scripts
+DYNAMIC_PY_INDICATORS = (
+    "Path.home()",
+    "os.path.expanduser",
+    "getpass.getuser()",
+    "os.environ.get('USER')",
+    "os.environ.get('USERNAME')",
+    "from roo_modes_sync.utils.dynamic_paths",  # Our dynamic path utilities
+    "find_existing_custom_modes_file",
+    "get_custom_modes_path"
+)
+
+# Dynamic path resolution markers expected in JavaScript files
+DYNAMIC_JS_INDICATORS = (
+    "process.env.HOME",
+    "process.env.USER",
+    "process.cwd()",
+    "os.homedir()",
+    "${workspace"  # Template variable
+)
+
+# Workspace placeholders expected in documentation examples
+TEMPLATE_INDICATORS = (
+    "${workspace}",
+    "[WORKSPACE_PATH]",
+    "/path/to/workspace",
+    "process.env.WORKSPACE",
+    "YOUR_WORKSPACE_PATH"
+)
+
+# Username placeholders expected in TROUBLESHOOTING.md
+USERNAME_TEMPLATE_INDICATORS = (
+    "[YourUsername]",
+    "[USERNAME]",
+    "${USER}",
+    "[USER]",
+    "your-username"
+)
+
+def _compile_indicators(indicators):
+    """Compile indicators into one alternation that finds all of them in a single pass."""
+    return re.compile("|".join(re.escape(indicator) for indicator in indicators))
+
+
+HARDCODED_PATTERNS_RE = _compile_indicators(HARDCODED_PATTERNS)
+DYNAMIC_PY_RE = _compile_indicators(DYNAMIC_PY_INDICATORS)
+DYNAMIC_JS_RE = _compile_indicators(DYNAMIC_JS_INDICATORS)
+TEMPLATE_RE = _compile_indicators(TEMPLATE_INDICATORS)
+USERNAME_TEMPLATE_RE = _compile_indicators(USERNAME_TEMPLATE_INDICATORS)
+
+
+def find_indicators(content, indicators_re):
+    """Return the sorted set of indicators matched by indicators_re in content."""
+    return sorted(set(indicators_re.findall(content)))
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """One temporary workspace directory shared by the whole session."""
+    return tmp_path_factory.mktemp("ws")
+
+
+def _collect_js_docs():
+    """List JavaScript documentation examples at collection time."""
+    docs_dir = _PROJECT_ROOT / "docs" / "examples"
+    if not docs_dir.is_dir():
+        return ()
+    with os.scandir(docs_dir) as entries:
+        return tuple(sorted(
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".js") and entry.is_file()
+        ))
+
+
+# Documentation examples known to have carried hardcoded paths
+SPECIFIC_EXAMPLE_FILES = (
+    "validation-checkpoints-usage.js",
+    "docs-mode-enhancement-usage.js",
+    "knowledge-first-guidelines-usage.js"
+)
+
+
+@pytest.fixture(scope="module")
+def cli_content():
+    """Text of cli.py, read once per module."""
+    return (_PKG_DIR / "cli.py").read_text()
+
+
 class TestDynamicUsernamePaths:
     """Test suite for dynamic username path resolution."""
     
-    def test_no_hardcoded_usernames_in_cli_module(self):
+    @pytest.mark.parametrize("pattern", HARDCODED_PATTERNS)
+    def test_no_hardcoded_usernames_in_cli_module(self, cli_content, pattern):
         """
         Test that CLI module does not contain hardcoded usernames.
         """
-        cli_file = Path(__file__).parent.parent / "cli.py"
-        content = cli_file.read_text()
-        
-        # Check for common hardcoded username patterns
-        hardcoded_patterns = [
-            "/home/user/",
-            "/home/admin/",
-            "/home/developer/",
-            "/Users/user/",
-            "C:\\Users\\user\\",
-            "C:\\Users\\admin\\"
-        ]
-        
-        for pattern in hardcoded_patterns:
-            assert pattern not in content, f"Found hardcoded path pattern '{pattern}' in cli.py"
+        assert pattern not in cli_content, f"Found hardcoded path pattern '{pattern}' in cli.py"
     
     def test_get_user_home_directory_dynamically(self):
         """
@@ -84,18 +171,18 @@ class TestDynamicUsernamePaths:
         Test that configuration paths can be built dynamically without hardcoded usernames.
         """
         # Test VSCode/VSCodium paths
-        home = Path.home()
+        home_str = str(Path.home())
         
         # Common VSCode config locations
         vscode_configs = [
-            home / ".config" / "Code" / "User" / "globalStorage" / "rooveterinaryinc.roo-cline" / "settings",
-            home / ".config" / "VSCodium" / "User" / "globalStorage" / "rooveterinaryinc.roo-cline" / "settings",
+            os.path.join(home_str, ".config", app_name, "User", "globalStorage", "rooveterinaryinc.roo-cline", "settings")
+            for app_name in ("Code", "VSCodium")
         ]
         
         for config_path in vscode_configs:
             # Path should be absolute and under user's home
-            assert config_path.is_absolute(), f"Config path should be absolute: {config_path}"
-            assert str(config_path).startswith(str(home)), f"Config path should be under user home: {config_path}"
+            assert os.path.isabs(config_path), f"Config path should be absolute: {config_path}"
+            assert config_path.startswith(home_str), f"Config path should be under user home: {config_path}"
             # We can't assert these exist since they depend on VSCode installation
     
     def test_workspace_paths_without_hardcoded_usernames(self):
@@ -107,8 +194,7 @@ class TestDynamicUsernamePaths:
         assert cwd_path.is_absolute(), "Current working directory should be absolute"
         
         # Script-relative method (like our current implementation)
-        script_dir = Path(__file__).resolve().parent
-        project_root = script_dir.parent.parent  # From test dir to project root
+        project_root = _PROJECT_ROOT  # From test dir to project root
         assert project_root.is_absolute(), "Project root should be absolute"
         
         # Environment variable method
@@ -124,29 +210,18 @@ class TestFixGlobalConfigScript:
         """
         Test that fix_global_config.py should use dynamic path resolution.
         """
-        fix_script_path = Path(__file__).parent.parent.parent / "fix_global_config.py"
+        fix_script_path = _PROJECT_ROOT / "fix_global_config.py"
         
         if fix_script_path.exists():
             content = fix_script_path.read_text()
             
             # This test will initially fail - that's the point of TDD
-            assert "/home/user/" not in content, "fix_global_config.py should not contain hardcoded '/home/user/' paths"
-            assert "/home/admin/" not in content, "fix_global_config.py should not contain hardcoded '/home/admin/' paths"
+            found = find_indicators(content, HARDCODED_PATTERNS_RE)
+            assert not found, f"fix_global_config.py should not contain hardcoded paths: {found}"
             
             # Should contain dynamic path resolution
-            dynamic_indicators = [
-                "Path.home()",
-                "os.path.expanduser",
-                "getpass.getuser()",
-                "os.environ.get('USER')",
-                "os.environ.get('USERNAME')",
-                "from roo_modes_sync.utils.dynamic_paths",  # Our dynamic path utilities
-                "find_existing_custom_modes_file",
-                "get_custom_modes_path"
-            ]
-            
-            has_dynamic = any(indicator in content for indicator in dynamic_indicators)
-            assert has_dynamic, f"fix_global_config.py should use dynamic path resolution methods: {dynamic_indicators}"
+            assert find_indicators(content, DYNAMIC_PY_RE), \
+                f"fix_global_config.py should use dynamic path resolution methods: {DYNAMIC_PY_INDICATORS}"
 
 
 class TestUtilitiesAndDocs:
@@ -156,99 +231,63 @@ class TestUtilitiesAndDocs:
         """
         Test that utilities mode enhancement files use dynamic workspace paths.
         """
-        enhancement_file = Path(__file__).parent.parent.parent / "utilities" / "modes" / "docs-mode-enhancement.js"
+        enhancement_file = _PROJECT_ROOT / "utilities" / "modes" / "docs-mode-enhancement.js"
         
         if enhancement_file.exists():
             content = enhancement_file.read_text()
             
             # This test will initially fail - that's the point of TDD
-            assert "/home/user/" not in content, "docs-mode-enhancement.js should not contain hardcoded '/home/user/' paths"
+            assert "/home/user/" not in content, \
+                "docs-mode-enhancement.js should not contain hardcoded '/home/user/' paths"
             
             # Should use environment variables or dynamic detection
-            dynamic_indicators = [
-                "process.env.HOME",
-                "process.env.USER",
-                "process.cwd()",
-                "os.homedir()",
-                "${workspace"  # Template variable
-            ]
-            
-            has_dynamic = any(indicator in content for indicator in dynamic_indicators)
-            assert has_dynamic, f"docs-mode-enhancement.js should use dynamic path resolution: {dynamic_indicators}"
+            assert find_indicators(content, DYNAMIC_JS_RE), \
+                f"docs-mode-enhancement.js should use dynamic path resolution: {DYNAMIC_JS_INDICATORS}"
     
-    def test_documentation_examples_use_template_paths(self):
+    @pytest.mark.parametrize("doc_file", _collect_js_docs(), ids=lambda path: path.name)
+    def test_documentation_examples_use_template_paths(self, doc_file):
         """
         Test that documentation examples use template paths instead of hardcoded ones.
         """
-        docs_dir = Path(__file__).parent.parent.parent / "docs" / "examples"
+        content = doc_file.read_text()
         
-        if docs_dir.exists():
-            for doc_file in docs_dir.glob("*.js"):
-                content = doc_file.read_text()
-                
-                # Should not contain hardcoded user paths
-                assert "/home/user/" not in content, f"{doc_file.name} should not contain hardcoded '/home/user/' paths"
-                
-                # Should use template variables or placeholders
-                if "workspace" in content.lower():
-                    template_indicators = [
-                        "${workspace}",
-                        "[WORKSPACE_PATH]",
-                        "/path/to/workspace",
-                        "process.env.WORKSPACE",
-                        "YOUR_WORKSPACE_PATH"
-                    ]
-                    
-                    has_template = any(indicator in content for indicator in template_indicators)
-                    assert has_template, f"{doc_file.name} should use template variables for workspace paths"
+        # Should not contain hardcoded user paths
+        assert "/home/user/" not in content, \
+            f"{doc_file.name} should not contain hardcoded '/home/user/' paths"
+        
+        # Should use template variables or placeholders
+        if "workspace" in content.lower():
+            assert find_indicators(content, TEMPLATE_RE), \
+                f"{doc_file.name} should use template variables for workspace paths"
     
-    def test_specific_documentation_examples_hardcoded_paths(self):
+    @pytest.mark.parametrize("filename", SPECIFIC_EXAMPLE_FILES)
+    def test_specific_documentation_examples_hardcoded_paths(self, filename):
         """
         Test specific documentation examples that are known to have hardcoded paths.
         This test is designed to fail until the examples are fixed.
         """
-        example_files = [
-            "validation-checkpoints-usage.js",
-            "docs-mode-enhancement-usage.js",
-            "knowledge-first-guidelines-usage.js"
-        ]
-        
-        docs_dir = Path(__file__).parent.parent.parent.parent / "docs" / "examples"
-        hardcoded_files_found = []
-        
-        for filename in example_files:
-            file_path = docs_dir / filename
-            if file_path.exists():
-                content = file_path.read_text()
-                if "/home/user/" in content:
-                    hardcoded_files_found.append(filename)
+        file_path = _REPO_ROOT / "docs" / "examples" / filename
         
-        # This should fail until we fix the files
-        assert len(hardcoded_files_found) == 0, f"These files contain hardcoded '/home/user/' paths: {hardcoded_files_found}"
+        if file_path.exists():
+            content = file_path.read_text()
+            assert "/home/user/" not in content, f"{filename} contains hardcoded '/home/user/' paths"
     
     def test_troubleshooting_guide_uses_template_paths(self):
         """
         Test that TROUBLESHOOTING.md uses template paths instead of hardcoded usernames.
         """
-        troubleshooting_file = Path(__file__).parent.parent.parent / "TROUBLESHOOTING.md"
+        troubleshooting_file = _PROJECT_ROOT / "TROUBLESHOOTING.md"
         
-        if troubleshooting_file.exists():
-            content = troubleshooting_file.read_text()
-            
-            # Should use template notation like [YourUsername] instead of specific usernames
-            template_indicators = [
-                "[YourUsername]",
-                "[USERNAME]",
-                "${USER}",
-                "[USER]",
-                "your-username"
-            ]
-            
-            has_template = any(indicator in content for indicator in template_indicators)
-            
-            # If it mentions home directories, it should use templates
-            if "/home/" in content:
-                assert has_template, "TROUBLESHOOTING.md should use template variables like [YourUsername] for paths"
+        if not troubleshooting_file.exists():
+            return
+        
+        content = troubleshooting_file.read_text()
+        
+        # Only a guide that mentions home directories needs templates
+        # like [YourUsername] instead of specific usernames
+        if "/home/" in content:
+            assert find_indicators(content, USERNAME_TEMPLATE_RE), \
+                "TROUBLESHOOTING.md should use template variables like [YourUsername] for paths"
 
 
 class TestDynamicPathUtilities:
@@ -284,7 +323,7 @@ class TestDynamicPathUtilities:
         assert modes_path_vscodium.name == "custom_modes.yaml", "Should point to custom_modes.yaml"
         assert modes_path_vscode != modes_path_vscodium, "Different apps should have different modes paths"
     
-    def test_create_dynamic_workspace_resolver(self):
+    def test_create_dynamic_workspace_resolver(self, shared_tmp):
         """
         Test that we can create a utility for dynamic workspace resolution.
         """
@@ -300,16 +339,16 @@ class TestDynamicPathUtilities:
             # Fall back to current directory
             return Path.cwd().resolve()
         
+        temp_dir = str(shared_tmp)
+        
         # Test with explicit path
-        with tempfile.TemporaryDirectory() as temp_dir:
-            workspace_path = resolve_workspace_path(temp_dir)
-            assert workspace_path == Path(temp_dir).resolve()
+        workspace_path = resolve_workspace_path(temp_dir)
+        assert workspace_path == Path(temp_dir).resolve()
         
         # Test with environment variable
-        with tempfile.TemporaryDirectory() as temp_dir:
-            with patch.dict(os.environ, {"WORKSPACE_PATH": temp_dir}):
-                workspace_path = resolve_workspace_path()
-                assert workspace_path == Path(temp_dir).resolve()
+        with patch.dict(os.environ, {"WORKSPACE_PATH": temp_dir}):
+            workspace_path = resolve_workspace_path()
+            assert workspace_path == Path(temp_dir).resolve()
         
         # Test fallback to current directory
         with patch.dict(os.environ, {}, clear=True):
@@ -1,320 +1,302 @@
-"""Test cases for fixing complex group structures in global Roo configuration."""
+"""
+Test cases for fixing complex group structures in global Roo configuration.
 
+The global custom_modes.yaml (under the editor's rooveterinaryinc.roo-cline settings
+directory) holds a ``customModes`` list of mode entries shaped like::
+
+    - slug: mode-slug
+      name: Mode Name
+      roleDefinition: Mode description
+      groups: [...]      # Some entries carry complex groups that need fixing
+      source: local      # Development metadata
+
+Every test here works on its own copy of the config templates and writes only to its
+own tmp_path, so the module runs safely under the suite's parallel mode from the README:
+
+    pytest -n auto --dist=loadfile
+"""
+
+import copy
 import pytest
-import yaml
 import tempfile
+import yaml
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, List
 
+from roo_modes_sync.core.global_config_fixer import GlobalConfigFixer
 from roo_modes_sync.core.validation import ModeValidator, YAMLStructureError
+from roo_modes_sync.tests._yaml_fast import (
+    dump as yaml_dump,
+    dump_all as yaml_dump_all,
+    load_all as yaml_load_all,
+)
 
 
-class TestGlobalConfigGroupFixes:
-    """Test cases for fixing problematic group structures in global Roo configuration."""
-    
-    @pytest.fixture
-    def validator(self):
-        """Create a validator instance for testing."""
-        return ModeValidator()
-    
-    @pytest.fixture
-    def temp_config_file(self, tmp_path):
-        """Create a temporary global config file for testing."""
-        config_file = tmp_path / "custom_modes.yaml"
-        return config_file
-    
-    def create_problematic_global_config(self) -> Dict[str, Any]:
-        """Create a global config with problematic complex group structures using actual structure."""
-        return {
-            'customModes': [
-                {
-                    'slug': 'architect',
-                    'name': '🏗️ Architect',
-                    'roleDefinition': 'Architect mode for system design',
-                    'groups': [
-                        'read',
-                        {
-                            'edit': {
-                                'fileRegex': '\\.md$',
-                                'description': 'Documentation files (markdown files only)'
-                            }
-                        },
-                        'browser',
-                        'command',
-                        'mcp'
-                    ],
-                    'source': 'local'
-                },
+# Simple groups granted to full-access modes, in Roo's canonical order
+_ALL_GROUPS = ('read', 'edit', 'browser', 'command', 'mcp')
+
+
+# Global config with problematic complex group structures
+_PROBLEMATIC_GLOBAL_CONFIG = {
+    'customModes': [
+        {
+            'slug': 'architect',
+            'name': '🏗️ Architect',
+            'roleDefinition': 'Architect mode for system design',
+            'groups': [
+                'read',
                 {
-                    'slug': 'docs',
-                    'name': '📚 Docs',
-                    'roleDefinition': 'Documentation mode',
-                    'groups': [
-                        'read',
-                        {
-                            'edit': {
-                                'fileRegex': '\\.(md|rst|adoc|txt|yaml|json|toml|text|markdown)$',
-                                'description': 'Documentation, configuration, and text files'
-                            }
-                        },
-                        'mcp',
-                        'command'
-                    ],
-                    'source': 'local'
+                    'edit': {
+                        'fileRegex': '\\.md$',
+                        'description': 'Documentation files (markdown files only)'
+                    }
                 },
+                'browser',
+                'command',
+                'mcp'
+            ],
+            'source': 'local'
+        },
+        {
+            'slug': 'docs',
+            'name': '📚 Docs',
+            'roleDefinition': 'Documentation mode',
+            'groups': [
+                'read',
                 {
-                    'slug': 'mode-engineer',
-                    'name': '⚙️ Mode Engineer',
-                    'roleDefinition': 'Mode engineering specialist',
-                    'groups': [
-                        'read',
-                        {
-                            'edit': {
-                                'fileRegex': '^(modes|templates|docs|examples|utilities/(modes|frameworks/mode-engineer)).*$',
-                                'description': 'Mode engineering files (modes, templates, docs, examples, utilities)'
-                            }
-                        },
-                        'browser',
-                        'command',
-                        'mcp'
-                    ],
-                    'source': 'local'
+                    'edit': {
+                        'fileRegex': '\\.(md|rst|adoc|txt|yaml|json|toml|text|markdown)$',
+                        'description': 'Documentation, configuration, and text files'
+                    }
                 },
+                'mcp',
+                'command'
+            ],
+            'source': 'local'
+        },
+        {
+            'slug': 'mode-engineer',
+            'name': '⚙️ Mode Engineer',
+            'roleDefinition': 'Mode engineering specialist',
+            'groups': [
+                'read',
                 {
-                    'slug': 'mode-manager',
-                    'name': '📋 Mode Manager',
-                    'roleDefinition': 'Mode management specialist',
-                    'groups': [
-                        'read',
-                        {
-                            'edit': {
-                                'fileRegex': '\\.yaml$',
-                                'description': 'YAML configuration files'
-                            }
-                        },
-                        {
-                            'edit': {
-                                'fileRegex': '^\\.roomodes$',
-                                'description': 'Workspace-specific modes file'
-                            }
-                        },
-                        'mcp'
-                    ],
-                    'source': 'local'
+                    'edit': {
+                        'fileRegex': '^(modes|templates|docs|examples|utilities/(modes|frameworks/mode-engineer)).*$',
+                        'description': 'Mode engineering files (modes, templates, docs, examples, utilities)'
+                    }
                 },
+                'browser',
+                'command',
+                'mcp'
+            ],
+            'source': 'local'
+        },
+        {
+            'slug': 'mode-manager',
+            'name': '📋 Mode Manager',
+            'roleDefinition': 'Mode management specialist',
+            'groups': [
+                'read',
                 {
-                    'slug': 'code',
-                    'name': '💻 Code',
-                    'roleDefinition': 'General coding mode',
-                    'groups': ['read', 'edit', 'browser', 'command', 'mcp'],
-                    'source': 'global'
-                }
-            ]
-        }
-    
-    def create_fixed_global_config(self) -> Dict[str, Any]:
-        """Create a global config with fixed simple group structures using actual structure."""
-        return {
-            'customModes': [
-                {
-                    'slug': 'architect',
-                    'name': '🏗️ Architect',
-                    'roleDefinition': 'Architect mode for system design',
-                    'groups': ['read', 'edit', 'browser', 'command', 'mcp'],
-                    'source': 'local'
+                    'edit': {
+                        'fileRegex': '\\.yaml$',
+                        'description': 'YAML configuration files'
+                    }
                 },
                 {
-                    'slug': 'docs',
-                    'name': '📚 Docs',
-                    'roleDefinition': 'Documentation mode',
-                    'groups': ['read', 'edit', 'mcp', 'command'],
-                    'source': 'local'
+                    'edit': {
+                        'fileRegex': '^\\.roomodes$',
+                        'description': 'Workspace-specific modes file'
+                    }
                 },
-                {
-                    'slug': 'mode-engineer',
-                    'name': '⚙️ Mode Engineer',
-                    'roleDefinition': 'Mode engineering specialist',
-                    'groups': ['read', 'edit', 'browser', 'command', 'mcp'],
-                    'source': 'local'
-                },
-                {
-                    'slug': 'mode-manager',
-                    'name': '📋 Mode Manager',
-                    'roleDefinition': 'Mode management specialist',
-                    'groups': ['read', 'edit', 'mcp'],
-                    'source': 'local'
-                },
-                {
-                    'slug': 'code',
-                    'name': '💻 Code',
-                    'roleDefinition': 'General coding mode',
-                    'groups': ['read', 'edit', 'browser', 'command', 'mcp'],
-                    'source': 'global'
-                }
-            ]
+                'mcp'
+            ],
+            'source': 'local'
+        },
+        {
+            'slug': 'code',
+            'name': '💻 Code',
+            'roleDefinition': 'General coding mode',
+            'groups': list(_ALL_GROUPS),
+            'source': 'global'
         }
+    ]
+}
+
+
+@pytest.fixture
+def problematic_config_template() -> Dict[str, Any]:
+    """Global config with problematic complex group structures, deep-copied per test."""
+    return copy.deepcopy(_PROBLEMATIC_GLOBAL_CONFIG)
+
+
+# Global config with fixed simple group structures
+_FIXED_GLOBAL_CONFIG = {
+    'customModes': [
+        {
+            'slug': 'architect',
+            'name': '🏗️ Architect',
+            'roleDefinition': 'Architect mode for system design',
+            'groups': list(_ALL_GROUPS),
+            'source': 'local'
+        },
+        {
+            'slug': 'docs',
+            'name': '📚 Docs',
+            'roleDefinition': 'Documentation mode',
+            'groups': ['read', 'edit', 'mcp', 'command'],
+            'source': 'local'
+        },
+        {
+            'slug': 'mode-engineer',
+            'name': '⚙️ Mode Engineer',
+            'roleDefinition': 'Mode engineering specialist',
+            'groups': list(_ALL_GROUPS),
+            'source': 'local'
+        },
+        {
+            'slug': 'mode-manager',
+            'name': '📋 Mode Manager',
+            'roleDefinition': 'Mode management specialist',
+            'groups': ['read', 'edit', 'mcp'],
+            'source': 'local'
+        },
+        {
+            'slug': 'code',
+            'name': '💻 Code',
+            'roleDefinition': 'General coding mode',
+            'groups': list(_ALL_GROUPS),
+            'source': 'global'
+        }
+    ]
+}
+
+# Expected outcomes shared by the fix and identification tests
+_EXPECTED_PROBLEMATIC = frozenset({'architect', 'docs', 'mode-engineer', 'mode-manager'})
+_EXPECTED_FIXED_BY_SLUG = {mode['slug']: mode for mode in _FIXED_GLOBAL_CONFIG['customModes']}
+
+# Per-mode parameter sets, so each mode is collected as its own test item
+_PROBLEMATIC_MODES = [
+    mode for mode in _PROBLEMATIC_GLOBAL_CONFIG['customModes'] if mode['slug'] in _EXPECTED_PROBLEMATIC
+]
+_FIXED_MODES = _FIXED_GLOBAL_CONFIG['customModes']
+
+
+@pytest.fixture(scope="session")
+def validator() -> ModeValidator:
+    """Share one validator across the session; no test here changes its settings."""
+    return ModeValidator()
+
+
+@pytest.fixture(scope="session")
+def fixer() -> GlobalConfigFixer:
+    """Share one stateless GlobalConfigFixer across the session."""
+    return GlobalConfigFixer()
+
+
+def _dedup_groups(groups: List[Any]) -> List[Any]:
+    """Reduce groups to their names, keeping the first occurrence of each in order."""
+    return list(dict.fromkeys(group if isinstance(group, str) else next(iter(group)) for group in groups))
+
+
+def fix_complex_groups(config_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of config_data with complex groups reduced to their group names."""
+    fixed_modes = [
+        {**mode_config, 'groups': _dedup_groups(mode_config['groups'])} if 'groups' in mode_config
+        else dict(mode_config)
+        for mode_config in config_data.get('customModes', [])
+    ]
+    return {**config_data, 'customModes': fixed_modes}
+
+
+def _validate_in_memory(validator, mode_config, collect_warnings=False):
+    """Validate a mode's YAML structure straight from its dict, skipping the file round-trip."""
+    return validator.validate_yaml_structure_from_dict(
+        mode_config, f"{mode_config['slug']}.yaml", collect_warnings=collect_warnings
+    )
+
+
+class TestGlobalConfigGroupFixes:
+    """Test cases for fixing problematic group structures in global Roo configuration."""
     
-    def test_problematic_complex_groups_should_fail_validation(self, validator, temp_config_file):
+    @pytest.fixture
+    def temp_config_file(self, tmp_path):
+        """Create a temporary global config file for testing."""
+        config_file = tmp_path / "custom_modes.yaml"
+        return config_file
+    
+    @pytest.mark.parametrize("mode_config", _PROBLEMATIC_MODES, ids=lambda mode: mode['slug'])
+    def test_problematic_complex_groups_should_fail_validation(self, mode_config, validator):
         """Test that complex group structures with fileRegex and description fail validation."""
-        problematic_config = self.create_problematic_global_config()
-        
-        # Test each problematic mode individually
-        problematic_modes = ['architect', 'docs', 'mode-engineer', 'mode-manager']
-        
-        for mode_config in problematic_config['customModes']:
-            if mode_config['slug'] in problematic_modes:
-                mode_name = mode_config['slug']
-                
-                # Write individual mode to temp file for validation
-                temp_mode_file = temp_config_file.parent / f"{mode_name}.yaml"
-                with open(temp_mode_file, 'w') as f:
-                    yaml.dump(mode_config, f)
-                
-                # Validation should detect complex groups as problematic
-                # Note: Current validator might accept these, but we're establishing the test first
-                # The fix will ensure they get simplified
-                result = validator.validate_yaml_structure(str(temp_mode_file), collect_warnings=True)
-                
-                # Complex groups should be flagged as issues
-                has_complex_groups = any(
-                    isinstance(group, dict) for group in mode_config['groups']
-                )
-                assert has_complex_groups, f"Mode {mode_name} should have complex groups for this test"
+        mode_name = mode_config['slug']
+        
+        # Validation should detect complex groups as problematic
+        # Note: Current validator might accept these, but we're establishing the test first
+        # The fix will ensure they get simplified
+        result = _validate_in_memory(validator, mode_config, collect_warnings=True)
+        
+        # Complex groups should be flagged as issues
+        has_complex_groups = any(
+            isinstance(group, dict) for group in mode_config['groups']
+        )
+        assert has_complex_groups, f"Mode {mode_name} should have complex groups for this test"
     
-    def test_simple_groups_should_pass_validation(self, validator, temp_config_file):
+    @pytest.mark.parametrize("mode_config", _FIXED_MODES, ids=lambda mode: mode['slug'])
+    def test_simple_groups_should_pass_validation(self, mode_config, validator):
         """Test that simple group structures pass validation."""
-        fixed_config = self.create_fixed_global_config()
+        mode_name = mode_config['slug']
         
-        # Test each fixed mode individually
-        for mode_config in fixed_config['customModes']:
-            mode_name = mode_config['slug']
-            # Write individual mode to temp file for validation
-            temp_mode_file = temp_config_file.parent / f"{mode_name}_fixed.yaml"
-            with open(temp_mode_file, 'w') as f:
-                yaml.dump(mode_config, f)
-            
-            # Validation should pass for simple groups
-            result = validator.validate_yaml_structure(str(temp_mode_file))
-            assert result is True, f"Mode {mode_name} with simple groups should pass validation"
-            
-            # Mode validation should also pass
-            mode_result = validator.validate_mode_config(mode_config, f"{mode_name}.yaml")
-            assert mode_result is True, f"Mode {mode_name} should pass mode validation"
+        # Validation should pass for simple groups
+        result = _validate_in_memory(validator, mode_config)
+        assert result is True, f"Mode {mode_name} with simple groups should pass validation"
+        
+        # Mode validation should also pass
+        mode_result = validator.validate_mode_config(mode_config, f"{mode_name}.yaml")
+        assert mode_result is True, f"Mode {mode_name} should pass mode validation"
     
-    def test_identify_modes_with_complex_groups(self, temp_config_file):
+    def test_identify_modes_with_complex_groups(self, problematic_config_template):
         """Test identification of modes that need group structure fixes."""
-        problematic_config = self.create_problematic_global_config()
-        
-        # Write full config to temp file
-        with open(temp_config_file, 'w') as f:
-            yaml.dump(problematic_config, f)
+        problematic_config = problematic_config_template
         
         # Function to identify problematic modes
         def identify_problematic_modes(config_data):
-            problematic_modes = []
-            custom_modes = config_data.get('customModes', [])
-            for mode_config in custom_modes:
-                mode_name = mode_config.get('slug', 'unknown')
-                if 'groups' in mode_config:
-                    groups = mode_config['groups']
-                    for group in groups:
-                        if isinstance(group, dict):
-                            # Check if it has the problematic fileRegex/description structure
-                            for group_name, group_config in group.items():
-                                if isinstance(group_config, dict) and (
-                                    'fileRegex' in group_config or 'description' in group_config
-                                ):
-                                    problematic_modes.append(mode_name)
-                                    break
-                    if mode_name in problematic_modes:
-                        continue
-            return problematic_modes
+            # A mode is problematic once any group carries the fileRegex/description structure
+            return [
+                mode_config.get('slug', 'unknown')
+                for mode_config in config_data.get('customModes', [])
+                if any(
+                    isinstance(group, dict) and any(
+                        isinstance(group_config, dict) and (
+                            'fileRegex' in group_config or 'description' in group_config
+                        )
+                        for group_config in group.values()
+                    )
+                    for group in mode_config.get('groups', [])
+                )
+            ]
         
         problematic_modes = identify_problematic_modes(problematic_config)
         
         # Should identify the 4 problematic modes
-        expected_problematic = ['architect', 'docs', 'mode-engineer', 'mode-manager']
-        assert set(problematic_modes) == set(expected_problematic)
+        assert frozenset(problematic_modes) == _EXPECTED_PROBLEMATIC
     
-    def test_fix_complex_groups_to_simple_groups(self, temp_config_file):
+    def test_fix_complex_groups_to_simple_groups(self, problematic_config_template):
         """Test conversion of complex groups to simple groups."""
-        problematic_config = self.create_problematic_global_config()
-        expected_fixed_config = self.create_fixed_global_config()
-        
-        # Function to fix complex groups
-        def fix_complex_groups(config_data):
-            fixed_config = config_data.copy()
-            fixed_custom_modes = []
-            
-            for mode_config in config_data.get('customModes', []):
-                fixed_mode_config = mode_config.copy()
-                if 'groups' in mode_config:
-                    groups = mode_config['groups']
-                    fixed_groups = []
-                    seen_groups = set()
-                    for group in groups:
-                        if isinstance(group, str):
-                            # Simple group - keep as is
-                            if group not in seen_groups:
-                                fixed_groups.append(group)
-                                seen_groups.add(group)
-                        elif isinstance(group, dict):
-                            # Complex group - extract the group name only
-                            for group_name, group_config in group.items():
-                                if group_name not in seen_groups:
-                                    fixed_groups.append(group_name)
-                                    seen_groups.add(group_name)
-                        else:
-                            # Other types - keep as is (shouldn't happen in valid config)
-                            fixed_groups.append(group)
-                    fixed_mode_config['groups'] = fixed_groups
-                fixed_custom_modes.append(fixed_mode_config)
-            
-            fixed_config['customModes'] = fixed_custom_modes
-            return fixed_config
+        problematic_config = problematic_config_template
         
         fixed_config = fix_complex_groups(problematic_config)
         
         # Verify the fixed config matches our expected simple structure
-        expected_modes = {mode['slug']: mode for mode in expected_fixed_config['customModes']}
         fixed_modes = {mode['slug']: mode for mode in fixed_config['customModes']}
         
-        for mode_slug in expected_modes:
+        for mode_slug, expected_mode in _EXPECTED_FIXED_BY_SLUG.items():
             assert mode_slug in fixed_modes
-            assert fixed_modes[mode_slug]['groups'] == expected_modes[mode_slug]['groups']
+            assert fixed_modes[mode_slug]['groups'] == expected_mode['groups']
     
-    def test_preserve_non_group_fields_during_fix(self, temp_config_file):
+    def test_preserve_non_group_fields_during_fix(self, problematic_config_template):
         """Test that non-group fields are preserved when fixing groups."""
-        problematic_config = self.create_problematic_global_config()
-        
-        # Function to fix complex groups (same as above)
-        def fix_complex_groups(config_data):
-            fixed_config = config_data.copy()
-            fixed_custom_modes = []
-            
-            for mode_config in config_data.get('customModes', []):
-                fixed_mode_config = mode_config.copy()
-                if 'groups' in mode_config:
-                    groups = mode_config['groups']
-                    fixed_groups = []
-                    seen_groups = set()
-                    for group in groups:
-                        if isinstance(group, str):
-                            if group not in seen_groups:
-                                fixed_groups.append(group)
-                                seen_groups.add(group)
-                        elif isinstance(group, dict):
-                            for group_name, group_config in group.items():
-                                if group_name not in seen_groups:
-                                    fixed_groups.append(group_name)
-                                    seen_groups.add(group_name)
-                        else:
-                            fixed_groups.append(group)
-                    fixed_mode_config['groups'] = fixed_groups
-                fixed_custom_modes.append(fixed_mode_config)
-            
-            fixed_config['customModes'] = fixed_custom_modes
-            return fixed_config
+        problematic_config = problematic_config_template
         
         fixed_config = fix_complex_groups(problematic_config)
         
@@ -326,99 +308,41 @@ class TestGlobalConfigGroupFixes:
             fixed_mode = fixed_modes[mode_slug]
             
             # Check all fields except groups are preserved
-            for field, value in original_mode.items():
-                if field != 'groups':
-                    assert fixed_mode[field] == value, f"Field {field} not preserved in {mode_slug}"
+            original_fields = {field: value for field, value in original_mode.items() if field != 'groups'}
+            fixed_fields = {field: value for field, value in fixed_mode.items() if field != 'groups'}
+            assert fixed_fields == original_fields, f"Non-group fields not preserved in {mode_slug}"
     
-    def test_end_to_end_config_fix_validation(self, validator, temp_config_file):
+    def test_end_to_end_config_fix_validation(self, problematic_config_template, validator):
         """Test complete end-to-end fix and validation process."""
-        problematic_config = self.create_problematic_global_config()
-        
-        # Function to fix complex groups
-        def fix_complex_groups(config_data):
-            fixed_config = config_data.copy()
-            fixed_custom_modes = []
-            
-            for mode_config in config_data.get('customModes', []):
-                fixed_mode_config = mode_config.copy()
-                if 'groups' in mode_config:
-                    groups = mode_config['groups']
-                    fixed_groups = []
-                    seen_groups = set()
-                    for group in groups:
-                        if isinstance(group, str):
-                            if group not in seen_groups:
-                                fixed_groups.append(group)
-                                seen_groups.add(group)
-                        elif isinstance(group, dict):
-                            for group_name, group_config in group.items():
-                                if group_name not in seen_groups:
-                                    fixed_groups.append(group_name)
-                                    seen_groups.add(group_name)
-                        else:
-                            fixed_groups.append(group)
-                    fixed_mode_config['groups'] = fixed_groups
-                fixed_custom_modes.append(fixed_mode_config)
-            
-            fixed_config['customModes'] = fixed_custom_modes
-            return fixed_config
+        problematic_config = problematic_config_template
         
         # Apply the fix
         fixed_config = fix_complex_groups(problematic_config)
         
-        # Write fixed config to temp file
-        with open(temp_config_file, 'w') as f:
-            yaml.dump(fixed_config, f)
+        # Serialize every fixed mode into one multi-document stream and parse it back
+        # with a single loader, as the modes would round-trip through YAML files
+        multi_doc = yaml_dump_all(fixed_config['customModes'])
         
         # Validate each mode in the fixed config
-        for mode_config in fixed_config['customModes']:
+        validated_slugs = []
+        for mode_config in yaml_load_all(multi_doc):
             mode_name = mode_config['slug']
-            # Test both YAML structure and mode config validation
-            temp_mode_file = temp_config_file.parent / f"{mode_name}_final.yaml"
-            with open(temp_mode_file, 'w') as f:
-                yaml.dump(mode_config, f)
+            validated_slugs.append(mode_name)
             
             # YAML structure should pass
-            yaml_result = validator.validate_yaml_structure(str(temp_mode_file))
+            yaml_result = _validate_in_memory(validator, mode_config)
             assert yaml_result is True, f"YAML structure validation failed for {mode_name}"
             
             # Mode config should pass
             mode_result = validator.validate_mode_config(mode_config, f"{mode_name}.yaml")
             assert mode_result is True, f"Mode config validation failed for {mode_name}"
-    
-    def test_actual_global_config_structure(self):
-        """Test the structure we expect to find in the actual global config file."""
-        # This test verifies our understanding of the global config structure
-        # Based on the file we read earlier, it should have multiple mode configurations
-        
-        global_config_path = "../../../.config/VSCodium/User/globalStorage/rooveterinaryinc.roo-cline/settings/custom_modes.yaml"
-        
-        # For this test, we'll simulate the structure we expect based on the file content
-        expected_structure = {
-            'slug_key': {
-                'slug': 'mode-slug',
-                'name': 'Mode Name',
-                'roleDefinition': 'Mode description',
-                'groups': [],  # This is what we're fixing
-                'source': 'local'  # Development metadata
-            }
-        }
         
-        # The actual structure should have multiple modes with this pattern
-        # Some have complex groups that need fixing
-        assert True  # This test documents the expected structure
+        # Every fixed mode should have survived the round-trip
+        assert validated_slugs == [mode['slug'] for mode in fixed_config['customModes']]
     
-    def test_warning_functionality_for_stripped_information(self, temp_config_file):
+    def test_warning_functionality_for_stripped_information(self, fixer, problematic_config_template):
         """Test that the fixer generates warnings about information being stripped."""
-        from roo_modes_sync.core.global_config_fixer import GlobalConfigFixer
-        
-        problematic_config = self.create_problematic_global_config()
-        
-        # Write config to temp file
-        with open(temp_config_file, 'w') as f:
-            yaml.dump(problematic_config, f)
-        
-        fixer = GlobalConfigFixer()
+        problematic_config = problematic_config_template
         
         # Test that we can extract stripped information details
         stripped_info = fixer.get_stripped_information_details(problematic_config)
@@ -443,17 +367,12 @@ class TestGlobalConfigGroupFixes:
         group_names = [info['group_name'] for info in manager_info]
         assert 'edit' in group_names  # Both are 'edit' but with different configs
         
-    def test_fix_with_warnings_returns_stripped_info(self, temp_config_file):
+    def test_fix_with_warnings_returns_stripped_info(self, fixer, problematic_config_template, temp_config_file):
         """Test that the fix operation returns detailed information about what was stripped."""
-        from roo_modes_sync.core.global_config_fixer import GlobalConfigFixer
-        
-        problematic_config = self.create_problematic_global_config()
+        problematic_config = problematic_config_template
         
         # Write config to temp file
-        with open(temp_config_file, 'w') as f:
-            yaml.dump(problematic_config, f)
-        
-        fixer = GlobalConfigFixer()
+        temp_config_file.write_text(yaml_dump(problematic_config))
         
         # Test the enhanced fix operation that includes warnings
         result = fixer.fix_global_config_file_with_warnings(temp_config_file, create_backup=False)
@@ -477,20 +396,14 @@ class TestGlobalConfigGroupFixes:
         assert 'warning_messages' in result
         warnings = result['warning_messages']
         assert len(warnings) > 0
-        assert any('fileRegex' in warning for warning in warnings)
-        assert any('description' in warning for warning in warnings)
-        
-    def test_warning_message_format(self, temp_config_file):
-        """Test that warning messages are properly formatted and informative."""
-        from roo_modes_sync.core.global_config_fixer import GlobalConfigFixer
         
-        problematic_config = self.create_problematic_global_config()
+        # Both kinds of stripped data should be mentioned
+        assert any('fileRegex' in w for w in warnings)
+        assert any('description' in w for w in warnings)
         
-        # Write config to temp file
-        with open(temp_config_file, 'w') as f:
-            yaml.dump(problematic_config, f)
-        
-        fixer = GlobalConfigFixer()
+    def test_warning_message_format(self, fixer, problematic_config_template):
+        """Test that warning messages are properly formatted and informative."""
+        problematic_config = problematic_config_template
         
         # Get warning messages
         warnings = fixer.generate_warning_messages(problematic_config)
@@ -511,17 +424,12 @@ class TestGlobalConfigGroupFixes:
         manager_warnings = [w for w in warnings if 'mode-manager' in w]
         assert len(manager_warnings) >= 2  # Should have warnings for both complex groups
         
-    def test_preserve_stripped_info_in_comments(self, temp_config_file):
+    def test_preserve_stripped_info_in_comments(self, fixer, problematic_config_template, temp_config_file):
         """Test that stripped information can optionally be preserved as comments."""
-        from roo_modes_sync.core.global_config_fixer import GlobalConfigFixer
-        
-        problematic_config = self.create_problematic_global_config()
+        problematic_config = problematic_config_template
         
         # Write config to temp file
-        with open(temp_config_file, 'w') as f:
-            yaml.dump(problematic_config, f)
-        
-        fixer = GlobalConfigFixer()
+        temp_config_file.write_text(yaml_dump(problematic_config))
         
         # Test fix with comment preservation option
         result = fixer.fix_global_config_file_with_warnings(
@@ -534,9 +442,18 @@ class TestGlobalConfigGroupFixes:
         assert result['success'] is True
         
         # Read the fixed file and check for comments
-        with open(temp_config_file, 'r') as f:
-            fixed_content = f.read()
+        fixed_content = temp_config_file.read_text()
         
         # Should contain comments about stripped information
         assert '#   - Stripped fileRegex for' in fixed_content or '# Original fileRegex:' in fixed_content
-        assert '#   - Stripped description for' in fixed_content or '# Original description:' in fixed_content
\ No newline at end of file
+        assert '#   - Stripped description for' in fixed_content or '# Original description:' in fixed_content
+        
+    def test_save_global_config_accepts_tuples(self, fixer, temp_config_file):
+        """Test that saving keeps the default dumper semantics for non-plain values."""
+        config = {'customModes': [{'slug': 'code', 'groups': ('read', 'edit')}]}
+        
+        fixer.save_global_config(config, temp_config_file)
+        
+        assert temp_config_file.read_text() == yaml.dump(
+            config, default_flow_style=False, sort_keys=False, indent=2
+        )
@@ -6,15 +6,16 @@ Tests to ensure MCP server provides complete backup functionality
 that matches the CLI backup features.
 """
 
+import copy
 import json
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 try:
-    from mcp import ModesMCPServer
-    from core.backup import BackupManager, BackupError
-    from exceptions import SyncError
+    from roo_modes_sync.mcp import ModesMCPServer
+    from roo_modes_sync.core.backup import BackupManager, BackupError
+    from roo_modes_sync.exceptions import SyncError
 except ImportError:
     # Fallback imports
     import sys
@@ -26,21 +27,33 @@ except ImportError:
     from exceptions import SyncError
 
 
+@pytest.fixture(scope="module")
+def modes_dir(tmp_path_factory):
+    """Create an empty modes directory, once per module."""
+    modes_dir = tmp_path_factory.mktemp("mcp_backup") / "modes"
+    modes_dir.mkdir()
+    return modes_dir
+
+
+@pytest.fixture(scope="module")
+def _empty_mcp_server(modes_dir):
+    """Construct an MCP server on the empty modes directory, once per module."""
+    return ModesMCPServer(modes_dir)
+
+
+@pytest.fixture
+def mcp_server(_empty_mcp_server):
+    """Provide a per-test shallow copy of the module's MCP server.
+
+    Overrides the conftest fixture so these tests keep running against
+    an empty modes directory rather than the shared populated one.
+    """
+    return copy.copy(_empty_mcp_server)
+
+
 class TestMCPBackupIntegration:
     """Test MCP server backup functionality integration."""
     
-    @pytest.fixture
-    def modes_dir(self, tmp_path):
-        """Create a temporary modes directory."""
-        modes_dir = tmp_path / "modes"
-        modes_dir.mkdir()
-        return modes_dir
-    
-    @pytest.fixture
-    def mcp_server(self, modes_dir):
-        """Create MCP server instance."""
-        return ModesMCPServer(modes_dir)
-    
     def test_mcp_server_has_backup_tools(self, mcp_server):
         """Test that MCP server defines backup-related tools."""
         tools = mcp_server._get_tool_definitions()
@@ -10,16 +10,14 @@ from pathlib import Path
 from unittest.mock import patch
 
 try:
-    from mcp import ModesMCPServer
-    from core.backup import BackupManager
-    from core.sync import ModeSync
+    from roo_modes_sync.core.backup import BackupManager
+    from roo_modes_sync.core.sync import ModeSync
 except ImportError:
     # Fallback imports
     import sys
     script_dir = Path(__file__).parent.parent
     sys.path.insert(0, str(script_dir))
     sys.path.insert(0, str(script_dir / "core"))
-    from mcp import ModesMCPServer
     from backup import BackupManager
     from sync import ModeSync
 
@@ -27,28 +25,6 @@ except ImportError:
 class TestMCPEndToEnd:
     """End-to-end tests for MCP server functionality."""
     
-    @pytest.fixture
-    def modes_dir(self, tmp_path):
-        """Create a temporary modes directory with test mode."""
-        modes_dir = tmp_path / "modes"
-        modes_dir.mkdir()
-        
-        # Create a test mode file
-        test_mode = modes_dir / "test-mode.yaml"
-        test_mode.write_text("""
-slug: test-mode
-name: Test Mode
-groups:
-  - edit
-  - ask
-""")
-        return modes_dir
-    
-    @pytest.fixture
-    def mcp_server(self, modes_dir):
-        """Create MCP server instance."""
-        return ModesMCPServer(modes_dir)
-    
     def test_complete_mcp_workflow(self, mcp_server, tmp_path):
         """Test complete MCP workflow: hello -> backup -> sync -> restore."""
         
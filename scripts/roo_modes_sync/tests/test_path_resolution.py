@@ -10,16 +10,12 @@ works correctly regardless of where it's executed from.
 import pytest
 import tempfile
 import os
-import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 import shutil
 
-# Add the parent directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 try:
-    from cli import get_default_modes_dir, main
+    from roo_modes_sync.cli import get_default_modes_dir, main
 except ImportError:
     # Fallback for initial test setup
     def get_default_modes_dir():
@@ -175,7 +171,7 @@ source: global
         
         # Test that the CLI can be called with our temporary structure
         # Since we're importing from the fallback, let's test the pattern directly
-        from cli import get_default_modes_dir as real_get_default_modes_dir
+        from roo_modes_sync.cli import get_default_modes_dir as real_get_default_modes_dir
         
         # Test that the real function returns an absolute path
         result = real_get_default_modes_dir()
@@ -231,7 +227,7 @@ source: global
             # Mock __file__ to point to our temporary CLI file
             cli_file = project_root / "scripts" / "roo_modes_sync" / "cli.py"
             
-            with patch('cli.Path') as mock_path_class:
+            with patch('roo_modes_sync.cli.Path') as mock_path_class:
                 # Mock Path(__file__).resolve().parent to return our temp structure
                 mock_file_path = MagicMock()
                 mock_file_path.resolve.return_value.parent = project_root / "scripts" / "roo_modes_sync"
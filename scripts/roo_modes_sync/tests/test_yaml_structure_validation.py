@@ -205,6 +205,23 @@ groups:
         assert len(issues) == 1
         assert "double-nested array" in issues[0].lower()
     
+    def test_validate_yaml_structure_from_dict(self, validator):
+        """Test structure validation of already-parsed YAML without a file."""
+        valid_config = {"slug": "test-mode", "groups": ["read", {"edit": {"fileRegex": "\\.md$"}}]}
+        assert validator.validate_yaml_structure_from_dict(valid_config) is True
+        
+        # Malformed groups are reported against the given source name
+        with pytest.raises(YAMLStructureError) as e:
+            validator.validate_yaml_structure_from_dict({"groups": [["edit"]]}, "test-mode.yaml")
+        assert "test-mode.yaml" in str(e.value)
+        assert "double-nested" in str(e.value).lower()
+        
+        # Non-dictionary content is collected as an error when warnings are requested
+        result = validator.validate_yaml_structure_from_dict(["read"], collect_warnings=True)
+        assert isinstance(result, ValidationResult)
+        assert result.valid is False
+        assert "dictionary" in result.warnings[0]['message']
+    
     def test_validate_yaml_structure_integration_with_mode_validation(self, validator, temp_mode_file):
         """Test that YAML structure validation integrates with mode validation."""
         # Write malformed YAML content to file